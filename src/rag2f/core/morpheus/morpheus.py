@@ -190,10 +190,10 @@ class Morpheus:
 
         for _, plugin in self.plugins.items():
             # cache hooks (indexed by hook name)
-            for h in plugin.hooks:
-                if h.name not in self.hooks:
-                    self.hooks[h.name] = []
-                self.hooks[h.name].append(h)
+            for hook_name, hooks in plugin.hooks_by_name.items():
+                if hook_name not in self.hooks:
+                    self.hooks[hook_name] = []
+                self.hooks[hook_name].extend(hooks)
 
         # sort each hooks list by priority
         for hook_name in self.hooks:
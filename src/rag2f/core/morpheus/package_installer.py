@@ -124,6 +124,8 @@ class PackageInstaller:
             tmp_file = self._create_temp_requirements(filtered_requirements)
             install_cmd = self._build_install_command(base_cmd, is_uv, requirements_file=tmp_file)
             self._run_install(install_cmd)
+            # the environment changed: rescan on the next install()
+            self._installed_packages = None
         finally:
             if tmp_file and os.path.exists(tmp_file):
                 try:
@@ -4,6 +4,7 @@ This module defines the `Plugin` class used by Morpheus to discover plugin
 metadata, load decorated hooks/overrides, and manage activation lifecycle.
 """
 
+import functools
 import glob
 import importlib
 import importlib.metadata
@@ -12,7 +13,9 @@ import json
 import logging
 import os
 import re
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from inspect import getmembers
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -29,6 +32,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# drops the separators ignored by Plugin._normalize_pkg_name (cheap pre-filter)
+_PKG_SEPARATORS = str.maketrans("", "", "-_.")
+
+# maps path separators to dots when turning relative file paths into module names
+_SEP_TO_DOT = str.maketrans(os.sep, ".")
+
+# plugins with more python files than this get their code read/compiled in parallel
+_PARALLEL_LOAD_MIN_FILES = 4
+
 
 # this class represents a plugin in memory
 # the plugin itsefl is managed as much as possible unix style
@@ -54,8 +66,12 @@ class Plugin:
         """
         self._rag2f_instance = rag2f_instance  # Store reference to RAG2F instance
 
-        # does folder exist?
-        if not os.path.exists(plugin_path) or not os.path.isdir(plugin_path):
+        # does folder exist? (a single stat covers both existence and type)
+        try:
+            st = os.stat(plugin_path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISDIR(st.st_mode):
             raise Exception(
                 f"{plugin_path} does not exist or is not a folder. Cannot create Plugin."
             )
@@ -90,7 +106,8 @@ class Plugin:
             )
 
         # plugin id is just the folder name
-        self._id: str = os.path.basename(os.path.normpath(plugin_path))
+        # (interned: ids are compared and used as keys all over the system)
+        self._id: str = sys.intern(os.path.basename(os.path.normpath(plugin_path)))
         logger.debug(f"Plugin created with path '{plugin_path}' -> id '{self._id}'")
 
         # plugin manifest (name, decription, thumb, etc.)
@@ -100,10 +117,18 @@ class Plugin:
         #   The Morpheus will cache them for easier access,
         #   but they are created and stored in each plugin instance
         self._hooks: list[PillHook] = []  # list of plugin hooks
+        # same hooks grouped by hook name (a plugin may define a name more than once)
+        self._hooks_by_name: dict[str, list[PillHook]] = {}
 
         # list of @plugin decorated functions overriding default plugin behaviour
         self._plugin_overrides = {}
 
+        # sys.modules entries created for this plugin, dropped on unload
+        self._loaded_modules: set[str] = set()
+
+        # dependency installer, created on first activation
+        self._installer: PackageInstaller | None = None
+
         # plugin starts deactivated
         self._active = False
 
@@ -136,10 +161,13 @@ class Plugin:
 
     def _module_name_for_file(self, py_file: str) -> str:
         rel = os.path.relpath(py_file, start=self._path)
-        rel_mod = rel.replace(os.sep, ".").replace(".py", "")
+        # py_files only ever holds "*.py" paths: drop the suffix, then map separators
+        rel_mod = rel[:-3].translate(_SEP_TO_DOT)
         return f"plugins.{self._id}.{rel_mod}"
 
     def _load_manifest(self) -> PluginManifest:
+        norm = PluginManifest.normalize_str
+
         plugin_path = Path(self._path)
         path_str = str(plugin_path)
         is_pip_like = "site-packages" in path_str or "dist-packages" in path_str
@@ -149,11 +177,8 @@ class Plugin:
             "pip" if is_pip_like else "fs",
         )
 
-        plugin_json_paths = self._discover_metadata_files(plugin_path, "plugin.json")
-        pyproject_paths = self._discover_metadata_files(plugin_path, "pyproject.toml")
-
-        plugin_json_path = plugin_json_paths[0] if plugin_json_paths else None
-        pyproject_path = pyproject_paths[0] if pyproject_paths else None
+        plugin_json_path = self._discover_metadata_file(plugin_path, "plugin.json")
+        pyproject_path = self._discover_metadata_file(plugin_path, "pyproject.toml")
 
         logger.info(
             "Discovered metadata for '%s': plugin.json=%s, pyproject.toml=%s",
@@ -173,13 +198,12 @@ class Plugin:
             base = self._map_plugin_json_to_manifest(data)
 
         if pyproject_path is not None:
-            data = self._read_toml_file(pyproject_path)
-            override = self._map_pyproject_to_manifest(data)
-            requirements.extend(self._extract_pyproject_dependencies(data))
+            override, deps = self._parse_pyproject_once(pyproject_path)
+            requirements.extend(deps)
 
         if base:
-            json_min = PluginManifest.normalize_str(base.get("min_rag2f_version"))
-            json_max = PluginManifest.normalize_str(base.get("max_rag2f_version"))
+            json_min = norm(base.get("min_rag2f_version"))
+            json_max = norm(base.get("max_rag2f_version"))
             json_bounds_set = bool(json_min or json_max)
             if json_bounds_set:
                 rag2f_bounds_origin = "JSON"
@@ -200,8 +224,8 @@ class Plugin:
                     )
                     data = self._read_json_file(Path(dist_plugin_json))
                     base = self._map_plugin_json_to_manifest(data)
-                    json_min = PluginManifest.normalize_str(base.get("min_rag2f_version"))
-                    json_max = PluginManifest.normalize_str(base.get("max_rag2f_version"))
+                    json_min = norm(base.get("min_rag2f_version"))
+                    json_max = norm(base.get("max_rag2f_version"))
                     json_bounds_set = bool(json_min or json_max)
                     if json_bounds_set:
                         rag2f_bounds_origin = "JSON"
@@ -211,9 +235,8 @@ class Plugin:
                     logger.info(
                         "Using pyproject.toml from distribution (FS missing): %s", dist_pyproject
                     )
-                    data = self._read_toml_file(Path(dist_pyproject))
-                    override = self._map_pyproject_to_manifest(data)
-                    requirements.extend(self._extract_pyproject_dependencies(data))
+                    override, deps = self._parse_pyproject_once(Path(dist_pyproject))
+                    requirements.extend(deps)
 
                 fallback = self._map_distribution_metadata_to_manifest(distribution)
                 dist_requires = [r for r in (distribution.requires or []) if isinstance(r, str)]
@@ -231,9 +254,7 @@ class Plugin:
             {
                 key
                 for key, value in override.items()
-                if PluginManifest.normalize_str(value) is not None
-                and PluginManifest.normalize_str(base.get(key))
-                != PluginManifest.normalize_str(value)
+                if norm(value) is not None and norm(base.get(key)) != norm(value)
             }
         )
         if overridden_by_pyproject:
@@ -244,15 +265,13 @@ class Plugin:
             )
 
         if is_pip_like and fallback:
-            before_fallback = dict(merged)
+            before_fallback = merged.copy()
             merged = PluginManifest.apply_fallback_defaults(merged, fallback)
             filled = sorted(
                 {
                     k
                     for k, v in merged.items()
-                    if PluginManifest.normalize_str(v)
-                    != PluginManifest.normalize_str(before_fallback.get(k))
-                    and k in fallback
+                    if norm(v) != norm(before_fallback.get(k)) and k in fallback
                 }
             )
             if filled:
@@ -263,7 +282,7 @@ class Plugin:
                 )
 
         # name resolution: try sources, else humanize id
-        normalized_name = PluginManifest.normalize_str(merged.get("name"))
+        normalized_name = norm(merged.get("name"))
         if normalized_name is None:
             merged["name"] = inflection.humanize(self.id)
             logger.warning(
@@ -276,15 +295,9 @@ class Plugin:
             min_v, max_v, origin = self._derive_rag2f_bounds_from_requirements(requirements)
             if origin != "Unknown":
                 rag2f_bounds_origin = origin
-            if (
-                PluginManifest.normalize_str(merged.get("min_rag2f_version")) is None
-                and min_v is not None
-            ):
+            if norm(merged.get("min_rag2f_version")) is None and min_v is not None:
                 merged["min_rag2f_version"] = min_v
-            if (
-                PluginManifest.normalize_str(merged.get("max_rag2f_version")) is None
-                and max_v is not None
-            ):
+            if norm(merged.get("max_rag2f_version")) is None and max_v is not None:
                 merged["max_rag2f_version"] = max_v
 
         logger.info(
@@ -307,7 +320,8 @@ class Plugin:
         except Exception as e:
             raise ValueError(f"Invalid JSON in {path}: {type(e).__name__}: {e}") from e
 
-    def _read_toml_file(self, path: Path) -> dict:
+    @staticmethod
+    def _read_toml_file(path: Path) -> dict:
         try:
             try:
                 import tomllib  # py3.11+
@@ -320,99 +334,114 @@ class Plugin:
             raise ValueError(f"Invalid TOML in {path}: {type(e).__name__}: {e}") from e
 
     def _map_plugin_json_to_manifest(self, data: dict) -> dict:
+        norm = PluginManifest.normalize_str
+        join_keywords = PluginManifest.join_keywords
+        serialize_urls = PluginManifest.serialize_urls
+
         out: dict = {}
 
-        out["name"] = PluginManifest.normalize_str(data.get("name"))
-        out["version"] = PluginManifest.normalize_str(data.get("version"))
-        out["keywords"] = PluginManifest.join_keywords(data.get("keywords"))
-        out["description"] = PluginManifest.normalize_str(data.get("description"))
-        out["license"] = PluginManifest.normalize_str(data.get("license"))
-        out["urls"] = PluginManifest.serialize_urls(data.get("urls"))
-        out["min_rag2f_version"] = PluginManifest.normalize_str(data.get("min_rag2f_version"))
-        out["max_rag2f_version"] = PluginManifest.normalize_str(data.get("max_rag2f_version"))
+        out["name"] = norm(data.get("name"))
+        out["version"] = norm(data.get("version"))
+        out["keywords"] = join_keywords(data.get("keywords"))
+        out["description"] = norm(data.get("description"))
+        out["license"] = norm(data.get("license"))
+        out["urls"] = serialize_urls(data.get("urls"))
+        out["min_rag2f_version"] = norm(data.get("min_rag2f_version"))
+        out["max_rag2f_version"] = norm(data.get("max_rag2f_version"))
 
         # author mapping (supports legacy author object)
-        out["author_name"] = PluginManifest.normalize_str(data.get("author_name"))
-        out["author_email"] = PluginManifest.normalize_str(data.get("author_email"))
+        out["author_name"] = norm(data.get("author_name"))
+        out["author_email"] = norm(data.get("author_email"))
 
         author_obj = data.get("author")
         if (out.get("author_name") is None or out.get("author_email") is None) and isinstance(
             author_obj, dict
         ):
             if out.get("author_name") is None:
-                out["author_name"] = PluginManifest.normalize_str(author_obj.get("name"))
+                out["author_name"] = norm(author_obj.get("name"))
             if out.get("author_email") is None:
-                out["author_email"] = PluginManifest.normalize_str(author_obj.get("email"))
+                out["author_email"] = norm(author_obj.get("email"))
 
         # Remove unset fields so defaults apply cleanly
         return {k: v for k, v in out.items() if v is not None}
 
-    def _map_pyproject_to_manifest(self, data: dict) -> dict:
+    def _parse_pyproject_once(self, path: Path) -> tuple[dict, list[str]]:
+        # The same pyproject.toml may be reached both from the FS and from the
+        # distribution: parse it once per (path, mtime, size) and hand out copies.
+        try:
+            st = os.stat(path)
+            fingerprint = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            fingerprint = (0, 0)  # let the reader surface the error
+        override, deps = self._parse_pyproject_cached(str(path), fingerprint)
+        return override.copy(), list(deps)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _parse_pyproject_cached(
+        path: str, fingerprint: tuple[int, int]
+    ) -> tuple[dict, tuple[str, ...]]:
+        data = Plugin._read_toml_file(Path(path))
         project = data.get("project") if isinstance(data, dict) else None
         if not isinstance(project, dict):
-            return {}
+            return {}, ()
+        deps = project.get("dependencies")
+        deps = tuple(d for d in deps if isinstance(d, str)) if isinstance(deps, list) else ()
+        return Plugin._map_pyproject_to_manifest(project), deps
+
+    @staticmethod
+    def _map_pyproject_to_manifest(project: dict) -> dict:
+        norm = PluginManifest.normalize_str
+        join_keywords = PluginManifest.join_keywords
+        serialize_urls = PluginManifest.serialize_urls
 
         out: dict = {}
-        out["name"] = PluginManifest.normalize_str(project.get("name"))
+        out["name"] = norm(project.get("name"))
 
         # version may be dynamic; if not a string, skip
         version = project.get("version")
-        out["version"] = (
-            PluginManifest.normalize_str(version) if isinstance(version, str) else None
-        )
+        out["version"] = norm(version) if isinstance(version, str) else None
 
-        out["description"] = PluginManifest.normalize_str(project.get("description"))
-        out["keywords"] = PluginManifest.join_keywords(project.get("keywords"))
+        out["description"] = norm(project.get("description"))
+        out["keywords"] = join_keywords(project.get("keywords"))
 
         # authors: first element
         authors = project.get("authors")
         if isinstance(authors, list) and authors:
             first = authors[0]
             if isinstance(first, dict):
-                out["author_name"] = PluginManifest.normalize_str(first.get("name"))
-                out["author_email"] = PluginManifest.normalize_str(first.get("email"))
+                out["author_name"] = norm(first.get("name"))
+                out["author_email"] = norm(first.get("email"))
 
         # license: string or table
         lic = project.get("license")
         if isinstance(lic, str):
-            out["license"] = PluginManifest.normalize_str(lic)
+            out["license"] = norm(lic)
         elif isinstance(lic, dict):
-            out["license"] = PluginManifest.normalize_str(
-                lic.get("text")
-            ) or PluginManifest.normalize_str(lic.get("file"))
+            out["license"] = norm(lic.get("text")) or norm(lic.get("file"))
 
-        out["urls"] = PluginManifest.serialize_urls(project.get("urls"))
+        out["urls"] = serialize_urls(project.get("urls"))
 
         return {k: v for k, v in out.items() if v is not None}
 
-    def _extract_pyproject_dependencies(self, data: dict) -> list[str]:
-        project = data.get("project") if isinstance(data, dict) else None
-        if not isinstance(project, dict):
-            return []
-        deps = project.get("dependencies")
-        if not isinstance(deps, list):
-            return []
-        return [d for d in deps if isinstance(d, str)]
-
     def _map_distribution_metadata_to_manifest(
         self, dist: importlib.metadata.Distribution
     ) -> dict:
+        norm = PluginManifest.normalize_str
         md = dist.metadata
         out: dict = {}
 
-        out["name"] = PluginManifest.normalize_str(md.get("Name"))
-        out["version"] = PluginManifest.normalize_str(
-            getattr(dist, "version", None) or md.get("Version")
-        )
-        out["description"] = PluginManifest.normalize_str(md.get("Summary"))
-        out["author_name"] = PluginManifest.normalize_str(md.get("Author"))
-        out["author_email"] = PluginManifest.normalize_str(md.get("Author-email"))
-        out["license"] = PluginManifest.normalize_str(md.get("License"))
-        out["keywords"] = PluginManifest.normalize_str(md.get("Keywords"))
+        out["name"] = norm(md.get("Name"))
+        out["version"] = norm(getattr(dist, "version", None) or md.get("Version"))
+        out["description"] = norm(md.get("Summary"))
+        out["author_name"] = norm(md.get("Author"))
+        out["author_email"] = norm(md.get("Author-email"))
+        out["license"] = norm(md.get("License"))
+        out["keywords"] = norm(md.get("Keywords"))
 
         # URLs: Home-page + Project-URL (may repeat)
         urls_parts: list[str] = []
-        home = PluginManifest.normalize_str(md.get("Home-page"))
+        home = norm(md.get("Home-page"))
         if home:
             urls_parts.append(f"Homepage={home}")
         project_urls = []
@@ -421,21 +450,24 @@ class Plugin:
         except Exception:
             project_urls = []
         for entry in project_urls:
-            s = PluginManifest.normalize_str(entry)
+            s = norm(entry)
             if s:
                 urls_parts.append(s)
         out["urls"] = ", ".join(urls_parts) if urls_parts else None
 
         return {k: v for k, v in out.items() if v is not None}
 
-    def _discover_metadata_files(self, plugin_path: Path, name: str) -> list[Path]:
+    def _discover_metadata_file(self, plugin_path: Path, name: str) -> Path | None:
         root_file = plugin_path / name
         if root_file.is_file():
-            return [root_file]
+            return root_file
 
-        candidates = [p for p in plugin_path.glob(f"**/{name}") if p.is_file()]
-        candidates.sort(key=lambda p: (len(p.relative_to(plugin_path).parents), str(p)))
-        return candidates
+        # shallowest match wins, ties broken by path
+        return min(
+            (p for p in plugin_path.glob(f"**/{name}") if p.is_file()),
+            key=lambda p: (len(p.relative_to(plugin_path).parents), str(p)),
+            default=None,
+        )
 
     def _resolve_distribution_for_plugin(self, plugin_path: Path):
         # Try by folder name and common normalizations
@@ -495,7 +527,7 @@ class Plugin:
                         exc_info=True,
                     )
                     continue
-        return sorted(matches)[0] if matches else None
+        return min(matches, default=None)
 
     def _normalize_pkg_name(self, name: str) -> str:
         return re.sub(r"[-_.]+", "", name).lower().strip()
@@ -514,6 +546,10 @@ class Plugin:
         for req in requirements:
             if not isinstance(req, str):
                 continue
+            # Cheap superset test before any regex work: a requirement naming
+            # rag2f must contain it once separators are dropped.
+            if "rag2f" not in req.lower().translate(_PKG_SEPARATORS):
+                continue
             raw = req.split(";", 1)[0].strip()
             if not raw:
                 continue
@@ -570,9 +606,12 @@ class Plugin:
         return min_v, max_v, "Dependency"
 
     def _install_requirements(self):
-        # Instance method that uses the new PackageInstaller logic
-        installer = PackageInstaller(self.id, self.path)
-        installer.install()
+        # Instance method that uses the new PackageInstaller logic.
+        # The installer is kept across activations so its detected package
+        # manager and installed-packages scan are reused on re-activation.
+        if self._installer is None:
+            self._installer = PackageInstaller(self.id, self.path)
+        self._installer.install()
 
     # lists of hooks
     def _load_decorated_functions(self):
@@ -630,6 +669,10 @@ class Plugin:
                 f"Created dummy '{plugin_pkg_name}' package in sys.modules for relative imports"
             )
 
+        # Read/compile module code up front (concurrently for larger plugins);
+        # execution below stays sequential and in file order.
+        prefetched = self._prefetch_module_code()
+
         for py_file in self.py_files:
             # Normalize the module name to a stable namespace (plugins.<plugin_id>.<relative_path>)
             # This avoids issues where the same file is imported with different module names
@@ -640,6 +683,7 @@ class Plugin:
             # By using a consistent module name, we ensure each plugin file is loaded only once.
             # Hook metadata (like plugin_id) is not accidentally overwritten by duplicate imports.
             module_name = self._module_name_for_file(py_file)
+            self._track_loaded_module(module_name)
 
             logger.debug(f"Import module {module_name} from {py_file}")
 
@@ -670,11 +714,16 @@ class Plugin:
                     plugin_module = sys.modules[module_name]
                 else:
                     # Load module directly from file path
-                    spec = importlib.util.spec_from_file_location(module_name, py_file)
+                    spec, code = prefetched.get(module_name, (None, None))
+                    if spec is None:
+                        spec = importlib.util.spec_from_file_location(module_name, py_file)
                     plugin_module = importlib.util.module_from_spec(spec)
                     sys.modules[module_name] = plugin_module
                     try:
-                        spec.loader.exec_module(plugin_module)
+                        if code is not None:
+                            exec(code, plugin_module.__dict__)  # noqa: S102
+                        else:
+                            spec.loader.exec_module(plugin_module)
                     except Exception:
                         # If execution fails, remove the partially-loaded module so
                         # a subsequent load attempt isn't stuck reusing a broken module.
@@ -693,33 +742,91 @@ class Plugin:
                 logger.warning(self.plugin_specific_error_message())
 
         # clean and enrich instances
-        self._hooks = list(map(self._clean_and_enrich_hook, hooks))
-        self._plugin_overrides = {
-            override.name: override
-            for override in list(map(self._clean_plugin_override, plugin_overrides))
-        }
+        self._hooks = [self._clean_and_enrich_hook(h) for h in hooks]
+        self._hooks_by_name = {}
+        for h in self._hooks:
+            self._hooks_by_name.setdefault(h.name, []).append(h)
+        # getmembers returns (name, value) tuples
+        self._plugin_overrides = {po[1].name: po[1] for po in plugin_overrides}
+
+    def _prefetch_module_code(self) -> dict:
+        """Read and compile plugin files concurrently.
+
+        Only source/bytecode reading and compilation run in parallel; modules are
+        still executed one by one by _load_decorated_functions, so decorator side
+        effects and relative imports behave as in a serial load. Files that fail
+        here are left out and go through the regular (error-reporting) path.
+        """
+        if len(self.py_files) <= _PARALLEL_LOAD_MIN_FILES:
+            return {}
+
+        def _get_code(py_file: str):
+            module_name = self._module_name_for_file(py_file)
+            if module_name in sys.modules:
+                return module_name, None, None
+            spec = importlib.util.spec_from_file_location(module_name, py_file)
+            return module_name, spec, spec.loader.get_code(module_name)
+
+        prefetched = {}
+        try:
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as pool:
+                futures = [pool.submit(_get_code, py_file) for py_file in self.py_files]
+                for future in futures:
+                    try:
+                        module_name, spec, code = future.result()
+                    except Exception as e:
+                        # the regular load path will report it
+                        logger.debug(f"Prefetch skipped a file of plugin {self._id}: {e}")
+                        continue
+                    if code is not None:
+                        prefetched[module_name] = (spec, code)
+        except Exception as e:
+            logger.debug(f"Parallel prefetch failed for plugin {self._id}: {e}")
+            return {}
+        return prefetched
+
+    def _track_loaded_module(self, module_name: str) -> None:
+        # Record the module and its intermediate packages (implicitly created when
+        # relative imports cross folders) down to plugins.<plugin_id>, so unload
+        # can drop them without scanning the whole of sys.modules.
+        plugin_pkg_name = f"plugins.{self._id}"
+        loaded = self._loaded_modules
+        while module_name != plugin_pkg_name and module_name not in loaded:
+            loaded.add(module_name)
+            module_name = module_name.rpartition(".")[0]
+        loaded.add(plugin_pkg_name)
 
     def _unload_decorated_functions(self) -> None:
         """Unload previously loaded plugin modules from sys.modules.
 
         This mirrors the stable module naming used by _load_decorated_functions
         (plugins.<plugin_id>.<relative_path>), and removes any submodules created
-        via relative imports under that namespace.
+        via relative imports under that namespace. Modules recorded at load time
+        are always dropped, and sys.modules is then swept for any other module
+        under the plugin's package (e.g. one imported indirectly by plugin code).
         """
-        plugin_pkg_name = f"plugins.{self._id}"
-        to_remove = [
-            name
-            for name in list(sys.modules.keys())
-            if name == plugin_pkg_name or name.startswith(plugin_pkg_name + ".")
-        ]
+        to_remove = self._loaded_modules.union(self._scan_sys_modules())
 
+        pop = sys.modules.pop
+        debug = logger.isEnabledFor(logging.DEBUG)
         for name in to_remove:
-            logger.debug(f"Remove module {name}")
-            sys.modules.pop(name, None)
+            pop(name, None)
+            if debug:
+                logger.debug("Remove module %s", name)
 
+        self._loaded_modules = set()
         self._hooks = []
+        self._hooks_by_name = {}
         self._plugin_overrides = {}
 
+    def _scan_sys_modules(self) -> list[str]:
+        plugin_pkg_name = f"plugins.{self._id}"
+        return [
+            name
+            for name in list(sys.modules.keys())
+            if name == plugin_pkg_name or name.startswith(plugin_pkg_name + ".")
+        ]
+
     #
     def plugin_specific_error_message(self):
         """Return a user-facing message to help report plugin load failures."""
@@ -748,6 +855,8 @@ class Plugin:
     def _clean_and_enrich_hook(self, hook: PillHook):
         # getmembers returns a tuple
         h = hook[1]
+        if type(h.name) is str:
+            h.name = sys.intern(h.name)
         # Only set plugin_id if not already set to avoid overwriting
         # when the same hook is loaded from different import paths
         if h.plugin_id is None:
@@ -759,10 +868,6 @@ class Plugin:
             )
         return h
 
-    def _clean_plugin_override(self, plugin_override):
-        # getmembers returns a tuple
-        return plugin_override[1]
-
     # a plugin hook function has to be decorated with @hook
     # (which returns an instance of PillHook)
     @staticmethod
@@ -807,6 +912,16 @@ class Plugin:
         """Return the list of hooks discovered in this plugin."""
         return self._hooks
 
+    @property
+    def hooks_by_name(self):
+        """Return the plugin hooks grouped by hook name, in load order."""
+        return self._hooks_by_name
+
+    @property
+    def hook_names(self):
+        """Return the names of the hooks defined by this plugin."""
+        return self._hooks_by_name.keys()
+
     @property
     def overrides(self):
         """Return lifecycle overrides discovered in this plugin."""
@@ -5,16 +5,25 @@ from __future__ import annotations
 from collections.abc import Iterable, Mapping
 from typing import Any, ClassVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+
+def _norm_str_fast(value: str) -> str | None:
+    """normalize_str specialized for values already known to be exactly `str`."""
+    s = value.strip()
+    return s if s else None
 
 
 class PluginManifest(BaseModel):
     """Normalized plugin metadata.
 
     This model merges metadata from `plugin.json`, `pyproject.toml`, and (for
-    installed distributions) package metadata.
+    installed distributions) package metadata. Instances are immutable (and
+    therefore hashable) once built.
     """
 
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True, extra="ignore")
+
     # id: str id plugin set and defined from Morpheus Plugin class
     name: str
     version: str = "0.0.0"
@@ -46,6 +55,11 @@ class PluginManifest(BaseModel):
         "min_rag2f_version": "Unknown",
         "max_rag2f_version": "Unknown",
     }
+    _DEFAULTS_ITEMS: ClassVar[tuple[tuple[str, str], ...]] = tuple(_DEFAULTS.items())
+
+    # URL labels serialized first (in this order) by serialize_urls
+    _URL_PRIORITY: ClassVar[tuple[str, ...]] = ("Homepage", "Repository", "Documentation")
+    _URL_PRIORITY_SET: ClassVar[frozenset[str]] = frozenset(_URL_PRIORITY)
 
     @classmethod
     def apply_fallback_defaults(cls, merged: dict, fallback: dict) -> dict:
@@ -54,14 +68,18 @@ class PluginManifest(BaseModel):
         A field is considered eligible if it's missing, empty, or still equal to
         the model default (e.g., "Unknown", default description, default version).
         """
-        out = dict(merged)
-        for field_name, default_value in cls._DEFAULTS.items():
-            current = out.get(field_name)
-            current_s = cls.normalize_str(current)
+        norm = cls.normalize_str
+        out = merged.copy()
+        out_get = out.get
+        fallback_get = fallback.get
+        for field_name, default_value in cls._DEFAULTS_ITEMS:
+            current = out_get(field_name)
+            current_s = _norm_str_fast(current) if type(current) is str else norm(current)
             needs_fallback = current is None or current_s is None or current_s == default_value
             if not needs_fallback:
                 continue
-            fallback_s = cls.normalize_str(fallback.get(field_name))
+            fb = fallback_get(field_name)
+            fallback_s = _norm_str_fast(fb) if type(fb) is str else norm(fb)
             if fallback_s is not None:
                 out[field_name] = fallback_s
         return out
@@ -76,6 +94,8 @@ class PluginManifest(BaseModel):
         Returns:
             A trimmed string, or None if the value is empty/None.
         """
+        if type(value) is str:
+            return _norm_str_fast(value)
         if value is None:
             return None
         if isinstance(value, str):
@@ -97,9 +117,10 @@ class PluginManifest(BaseModel):
         if value is None:
             return None
         if isinstance(value, (list, tuple)):
+            norm = PluginManifest.normalize_str
             parts: list[str] = []
             for item in value:
-                s = PluginManifest.normalize_str(item)
+                s = _norm_str_fast(item) if type(item) is str else norm(item)
                 if s:
                     parts.append(s)
             return ", ".join(parts) if parts else None
@@ -120,29 +141,23 @@ class PluginManifest(BaseModel):
         if isinstance(value, str):
             return PluginManifest.normalize_str(value)
         if isinstance(value, (list, tuple)):
+            norm = PluginManifest.normalize_str
             parts: list[str] = []
             for item in value:
-                s = PluginManifest.normalize_str(item)
+                s = _norm_str_fast(item) if type(item) is str else norm(item)
                 if s:
                     parts.append(s)
             return ", ".join(parts) if parts else None
         if isinstance(value, Mapping):
-            # Deterministic serialization with priority keys.
-            priority = ["Homepage", "Repository", "Documentation"]
-            items: list[tuple[str, str]] = []
-
-            def add_key(k: str):
-                if k in value:
-                    v = PluginManifest.normalize_str(value.get(k))
-                    if v:
-                        items.append((k, v))
-
-            for k in priority:
-                add_key(k)
-
-            other_keys = sorted([k for k in value if k not in set(priority)])
-            for k in other_keys:
-                add_key(str(k))
+            if not value:
+                return None
+            # Deterministic serialization with priority keys: normalize every value
+            # once, then emit priority labels first and the rest alphabetically.
+            norm = PluginManifest.normalize_str
+            priority_set = PluginManifest._URL_PRIORITY_SET
+            normalized = {k: s for k, v in value.items() if isinstance(k, str) and (s := norm(v))}
+            items = [(k, normalized[k]) for k in PluginManifest._URL_PRIORITY if k in normalized]
+            items += sorted((k, v) for k, v in normalized.items() if k not in priority_set)
 
             return ", ".join([f"{k}={v}" for k, v in items]) if items else None
 
@@ -155,12 +170,21 @@ class PluginManifest(BaseModel):
 
         exclude: keys not eligible for this policy.
         """
+        norm = PluginManifest.normalize_str
+        merged = base.copy()
+        if not exclude:
+            # common case: no exclusions, skip the set build and per-key membership test
+            for key, value in override.items():
+                s = _norm_str_fast(value) if type(value) is str else norm(value)
+                if s is not None:
+                    merged[key] = s
+            return merged
+
         excluded = set(exclude)
-        merged = dict(base)
         for key, value in override.items():
             if key in excluded:
                 continue
-            s = PluginManifest.normalize_str(value)
+            s = _norm_str_fast(value) if type(value) is str else norm(value)
             if s is not None:
                 merged[key] = s
         return merged
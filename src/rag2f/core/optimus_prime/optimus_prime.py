@@ -9,9 +9,13 @@ manages the embedder ecosystem within RAG2F.
 """
 
 import logging
+import sys
+from collections.abc import KeysView
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Optional
 
 from rag2f.core.protocols import Embedder
+from rag2f.core.protocols.embedder import is_embedder
 
 logger = logging.getLogger(__name__)
 
@@ -29,10 +33,23 @@ class OptimusPrime:
     "Freedom is the right of all sentient beings."
     """
 
+    __slots__ = (
+        "_embedder_registry",
+        "_registry_view",
+        "_spock",
+        "_generation",
+        "_default_cache",
+    )
+
     def __init__(self, *, spock: Optional["Spock"] = None):
         """Initialize OptimusPrime embedder registry manager."""
         self._embedder_registry: dict[str, Embedder] = {}
+        self._registry_view = MappingProxyType(self._embedder_registry)
         self._spock = spock
+        # bumped on every registry mutation; guards the cached default embedder
+        self._generation = 0
+        # (generation, configured default key, embedder) of the last get_default()
+        self._default_cache: tuple[int, str | None, Embedder] | None = None
         logger.debug("OptimusPrime instance created.")
 
     def register(self, key: str, embedder: Embedder) -> None:
@@ -51,9 +68,12 @@ class OptimusPrime:
             raise ValueError(f"Invalid embedder key: {key!r}")
 
         # Protocol compliance
-        if not isinstance(embedder, Embedder):
+        if not is_embedder(embedder):
             raise TypeError(f"Embedder '{key}' does not implement the Embedder protocol")
 
+        if type(key) is str:  # sys.intern rejects str subclasses
+            key = sys.intern(key)
+
         # Override policy: do not allow overriding existing embedders.
         # Idempotency: allow registering the *same instance* twice.
         if key in self._embedder_registry:
@@ -66,6 +86,7 @@ class OptimusPrime:
             raise ValueError(f"Override not allowed for already registered embedder: {key!r}")
 
         self._embedder_registry[key] = embedder
+        self._generation += 1
         logger.debug("Embedder '%s' registered successfully.", key)
 
     def get(self, key: str) -> Embedder | None:
@@ -101,6 +122,16 @@ class OptimusPrime:
         """
         return list(self._embedder_registry.keys())
 
+    def iter_keys(self) -> KeysView[str]:
+        """Get a live, read-only view of the registered embedder keys.
+
+        Unlike list_keys, no list is allocated; the view reflects later changes.
+
+        Returns:
+            Keys view over the registry
+        """
+        return self._embedder_registry.keys()
+
     def unregister(self, key: str) -> bool:
         """Unregister an embedder by key.
 
@@ -108,6 +139,7 @@ class OptimusPrime:
         """
         if key in self._embedder_registry:
             del self._embedder_registry[key]
+            self._generation += 1
             logger.debug("Embedder '%s' unregistered.", key)
             return True
         return False
@@ -121,13 +153,23 @@ class OptimusPrime:
         Raises:
             LookupError: If no embedders are registered or default selection fails.
         """
+        normalized_key = self._resolve_default_key()
+
+        # Fast path: registry and configured key unchanged since the last call.
+        cache = self._default_cache
+        if cache is not None and cache[0] == self._generation and cache[1] == normalized_key:
+            return cache[2]
+
+        embedder = self._select_default(normalized_key)
+        self._default_cache = (self._generation, normalized_key, embedder)
+        return embedder
+
+    def _select_default(self, normalized_key: str | None) -> Embedder:
         registry_size = len(self._embedder_registry)
 
         if registry_size == 0:
             raise LookupError("No embedders registered; unable to determine default embedder.")
 
-        normalized_key = self._resolve_default_key()
-
         if registry_size == 1:
             only_key, embedder = next(iter(self._embedder_registry.items()))
             if normalized_key and normalized_key != only_key:
@@ -168,7 +210,16 @@ class OptimusPrime:
         Returns:
             A shallow copy of the embedder registry dictionary
         """
-        return dict(self._embedder_registry)
+        return self._embedder_registry.copy()
+
+    @property
+    def registry_view(self) -> MappingProxyType[str, Embedder]:
+        """Get a live, read-only view of the embedder registry.
+
+        Returns:
+            A mapping proxy over the registry (no copy is made)
+        """
+        return self._registry_view
 
 
 EmbedderManager = OptimusPrime
@@ -29,6 +29,31 @@ class Embedder(Protocol):
     #     ...
 
 
+# Concrete classes already known to satisfy Embedder at class level.
+_EMBEDDER_TYPES: set[type] = set()
+
+
+def is_embedder(obj: object) -> bool:
+    """Return True if obj implements the Embedder protocol.
+
+    The runtime-checkable Protocol check is comparatively slow, so its outcome
+    is remembered per concrete class. Only classes that expose both members
+    themselves are remembered; instances that rely on per-instance attributes
+    are always checked in full.
+
+    Args:
+        obj: Candidate embedder object.
+    """
+    cls = type(obj)
+    if cls in _EMBEDDER_TYPES:
+        return True
+    if not isinstance(obj, Embedder):
+        return False
+    if hasattr(cls, "size") and hasattr(cls, "getEmbedding"):
+        _EMBEDDER_TYPES.add(cls)
+    return True
+
+
 def register(reg: dict[str, Embedder], name: str, obj: object) -> None:
     """Register an embedder instance in a registry.
 
@@ -40,6 +65,6 @@ def register(reg: dict[str, Embedder], name: str, obj: object) -> None:
     Raises:
         TypeError: If obj does not implement the Embedder protocol.
     """
-    if not isinstance(obj, Embedder):  # funziona grazie a @runtime_checkable
+    if not is_embedder(obj):  # funziona grazie a @runtime_checkable
         raise TypeError(f"{name} does not implement Embedder (missing size/getEmbedding)")
     reg[name] = obj
@@ -17,15 +17,59 @@ Example: RAG2F__RAG2F__EMBEDDER_DEFAULT="test_embedder"
          RAG2F__PLUGINS__AZURE_OPENAI_EMBEDDER__API_KEY="..."
 """
 
+import functools
 import json
 import logging
 import os
+from collections.abc import Callable, Mapping
 from copy import deepcopy
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+# Use orjson's faster decoder when installed (the ``orjson`` extra); its errors
+# subclass json.JSONDecodeError, so callers handle both the same way.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:  # pragma: no cover
+
+    def _json_loads(data: str | bytes) -> Any:
+        """Decode with orjson, deferring to the stdlib for what orjson rejects.
+
+        orjson refuses NaN/Infinity and integers wider than 64 bits; retrying
+        with json.loads keeps results independent of the installed decoder.
+        """
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+else:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+_JSON_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+def _json_deepcopy(obj: Any) -> Any:
+    """Deep-copy JSON-shaped data (dicts, lists and scalars) without a memo.
+
+    Config trees come from JSON or env values, so they have no cycles or shared
+    references; other values (set at runtime) fall back to copy.deepcopy.
+    """
+    t = type(obj)
+    if t is dict:
+        return {k: _json_deepcopy(v) for k, v in obj.items()}
+    if t is list:
+        return [_json_deepcopy(v) for v in obj]
+    if t in _JSON_SCALARS:
+        return obj
+    return deepcopy(obj)
+
 
 class Spock:
     """Configuration manager for RAG2F instances.
@@ -39,6 +83,10 @@ class Spock:
 
     ENV_PREFIX = "RAG2F"
     ENV_SEPARATOR = "__"
+    _ENV_SECTIONS = frozenset({"rag2f", "plugins"})
+    # First characters a JSON document may start with (including leading
+    # whitespace and the NaN/Infinity constants json.loads accepts)
+    _JSON_FIRST_CHARS = frozenset('"{[-0123456789tfnNI \t\r\n')
 
     def __init__(self, config_path: str | None = None):
         """Initialize Spock configuration manager.
@@ -50,6 +98,17 @@ class Spock:
         self._config_path = config_path
         self._config = self.default_config()
         self._loaded = False
+        # Bumped on every load/set; read-only views are cached per version
+        self._snapshot_version = 0
+        self._views: dict[Any, MappingProxyType] = {}
+        self._views_version = -1
+        # Sources fingerprint and snapshot version of the last load, used by
+        # reload() to skip work when nothing changed (None: always reload)
+        self._source_fingerprint: tuple | None = None
+        self._loaded_version = -1
+        # (env_items, parsed entries) of the last env load; replayed while the
+        # RAG2F-prefixed variables are unchanged
+        self._env_entries_cache: tuple[tuple, list] | None = None
         logger.debug("Spock instance created with config_path=%s", config_path)
 
     @staticmethod
@@ -57,11 +116,13 @@ class Spock:
         """Return a new default config dict each time."""
         return {"rag2f": {}, "plugins": {}}
 
-    def load(self, config: dict[str, Any] | None = None) -> None:
+    def load(self, config: dict[str, Any] | None = None, *, copy: bool = True) -> None:
         """Load configuration from JSON file, environment variables, or provided config.
 
         Args:
             config: Optional config dict to use as base. If None, uses default_config().
+            copy: Deep-copy the sections of `config`. Pass False to adopt them as-is
+                when the caller hands over ownership of the dict.
 
         Priority (highest to lowest):
         1. Environment variables
@@ -74,51 +135,53 @@ class Spock:
             return
 
         self._config = self.default_config()
+        env_items = self._env_items()
+        source_fingerprint = (self._file_fingerprint(), env_items)
 
         # Load from JSON file if provided
         if self._config_path:
             self._load_from_json()
 
         if config is not None:
-            self._load_from_config_object(config)
+            self._load_from_config_object(config, copy=copy)
 
         # Override/merge with environment variables
-        self._load_from_env()
+        self._load_from_env(env_items)
 
         self._loaded = True
+        self._snapshot_version += 1
+        # A config object is not a re-readable source, reload() must not skip it
+        self._source_fingerprint = source_fingerprint if config is None else None
+        self._loaded_version = self._snapshot_version
         logger.info("Configuration loaded successfully")
-        logger.debug(
-            "Final config structure: rag2f keys=%s, plugins=%s",
-            list(self._config.get("rag2f", {}).keys()),
-            list(self._config.get("plugins", {}).keys()),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Final config structure: rag2f keys=%s, plugins=%s",
+                list(self._config["rag2f"]),
+                list(self._config["plugins"]),
+            )
 
     def _load_from_json(self) -> None:
         """Load configuration from JSON file."""
         try:
             config_file = Path(self._config_path)
-            if not config_file.exists():
+            try:
+                st = os.stat(config_file)
+            except FileNotFoundError:
                 logger.warning("Config file not found: %s", self._config_path)
                 return
 
-            with open(config_file, encoding="utf-8") as f:
-                json_config = json.load(f)
+            # Reloads of an unchanged file reuse the parsed document; the copy is
+            # private to this load, so its sections are adopted without copying again
+            json_config = _json_deepcopy(
+                self._read_json_cached(str(config_file), (st.st_mtime_ns, st.st_size))
+            )
 
             # Validate and merge JSON structure
             if not isinstance(json_config, dict):
                 raise ValueError("Configuration must be a JSON object")
 
-            # Merge rag2f settings
-            if "rag2f" in json_config:
-                if not isinstance(json_config["rag2f"], dict):
-                    raise ValueError("'rag2f' section must be an object")
-                self._config["rag2f"] = deepcopy(json_config["rag2f"])
-
-            # Merge plugin settings
-            if "plugins" in json_config:
-                if not isinstance(json_config["plugins"], dict):
-                    raise ValueError("'plugins' section must be an object")
-                self._config["plugins"] = deepcopy(json_config["plugins"])
+            self._merge_sections(json_config, "an object")
 
             logger.info("Loaded configuration from JSON: %s", self._config_path)
 
@@ -129,24 +192,57 @@ class Spock:
             logger.error("Error loading config file %s: %s", self._config_path, e)
             raise
 
-    def _load_from_config_object(self, config: dict[str, Any]) -> None:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _read_json_cached(path: str, fingerprint: tuple[int, int]) -> Any:
+        with open(path, "rb") as f:
+            return _json_loads(f.read())
+
+    def _load_from_config_object(self, config: dict[str, Any], *, copy: bool = True) -> None:
         """Validate and merge a config dict into self._config, like for JSON."""
         if not isinstance(config, dict):
             raise ValueError("Configuration must be a dict")
 
-        # Merge rag2f settings
-        if "rag2f" in config:
-            if not isinstance(config["rag2f"], dict):
-                raise ValueError("'rag2f' section must be a dict")
-            self._config["rag2f"] = deepcopy(config["rag2f"])
+        self._merge_sections(config, "a dict", copier=deepcopy if copy else None)
+
+    def _merge_sections(
+        self,
+        source: dict[str, Any],
+        expected: str,
+        copier: Callable[[Any], Any] | None = None,
+    ) -> None:
+        """Validate the rag2f/plugins sections of `source` and adopt them.
+
+        Args:
+            source: Parsed configuration object.
+            expected: Expected section type for error messages ("an object", "a dict").
+            copier: Optional copy function applied to each section before adopting it.
+        """
+        config = self._config
+        for section in ("rag2f", "plugins"):
+            if section not in source:
+                continue
+            value = source[section]
+            if not isinstance(value, dict):
+                raise ValueError(f"'{section}' section must be {expected}")
+            config[section] = copier(value) if copier is not None else value
+
+    def _file_fingerprint(self) -> tuple[int, int] | None:
+        """Return (mtime_ns, size) of the config file, or None if there is none."""
+        if not self._config_path:
+            return None
+        try:
+            st = os.stat(self._config_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
 
-        # Merge plugin settings
-        if "plugins" in config:
-            if not isinstance(config["plugins"], dict):
-                raise ValueError("'plugins' section must be a dict")
-            self._config["plugins"] = deepcopy(config["plugins"])
+    def _env_items(self) -> tuple[tuple[str, str], ...]:
+        """Return the RAG2F-prefixed environment variables as (key, value) pairs."""
+        prefix = f"{self.ENV_PREFIX}{self.ENV_SEPARATOR}"
+        return tuple((k, v) for k, v in os.environ.items() if k.startswith(prefix))
 
-    def _load_from_env(self) -> None:
+    def _load_from_env(self, env_items: tuple[tuple[str, str], ...] | None = None) -> None:
         """Load configuration from environment variables.
 
         Environment variables follow the pattern:
@@ -156,89 +252,129 @@ class Spock:
         - RAG2F__RAG2F__EMBEDDER_DEFAULT=azure_openai
         - RAG2F__PLUGINS__AZURE_OPENAI_EMBEDDER__API_KEY=sk-xxx
         - RAG2F__PLUGINS__AZURE_OPENAI_EMBEDDER__AZURE_ENDPOINT=https://...
+
+        Args:
+            env_items: Pre-collected prefixed variables; scanned from os.environ if None.
         """
-        prefix = f"{self.ENV_PREFIX}{self.ENV_SEPARATOR}"
+        set_nested_value = self._set_nested_value
+
+        if env_items is None:
+            env_items = self._env_items()
+        # Unchanged variables since the last load: replay the parsed entries
+        cached = self._env_entries_cache
+        if cached is not None and cached[0] == env_items:
+            entries = cached[1]
+        else:
+            entries = self._collect_env_entries(env_items)
+            self._env_entries_cache = (env_items, entries)
+
+        rag2f_config = self._config["rag2f"]
+        plugins_config = self._config["plugins"]
+        current_plugin_id = None
+        plugin_target: Any = None
+        for section, path, env_key, parsed_value in entries:
+            # Set the value (parsed values are shared with the cache, copy them)
+            try:
+                value = _json_deepcopy(parsed_value)
+                if section == "rag2f":
+                    # For rag2f section, path is direct: [embedder_default]
+                    set_nested_value(rag2f_config, path, value)
+                else:
+                    if path[0] != current_plugin_id:
+                        plugin_target = plugins_config.setdefault(path[0], {})
+                        current_plugin_id = path[0]
+                    set_nested_value(plugin_target, path[1:], value)
+                logger.debug("Set from env: %s = %s", env_key, parsed_value)
+            except Exception as e:
+                logger.error("Error processing env var %s: %s", env_key, e)
 
-        for env_key, env_value in os.environ.items():
-            if not env_key.startswith(prefix):
-                continue
+    def _collect_env_entries(
+        self, env_items: tuple[tuple[str, str], ...]
+    ) -> list[tuple[str, list[str], str, Any]]:
+        """Validate and parse prefixed env variables into (section, path, key, value).
+
+        Entries are sorted by (section, plugin_id) so consecutive keys of a plugin
+        reuse its resolved sub-dict when applied (the sort is stable within a group).
+        """
+        prefix_len = len(self.ENV_PREFIX) + len(self.ENV_SEPARATOR)
+        sep = self.ENV_SEPARATOR
+        sections = self._ENV_SECTIONS
+        parse_value = self._parse_env_value
 
-            # Remove prefix and split into path components
-            key_path = env_key[len(prefix) :].split(self.ENV_SEPARATOR)
+        entries: list[tuple[str, list[str], str, Any]] = []
+        for env_key, env_value in env_items:
+            # Remove prefix, lowercase once and split into section + path components
+            section, *path = env_key[prefix_len:].lower().split(sep)
 
-            if len(key_path) < 2:
+            if not path:
                 logger.warning("Invalid env var format (too short): %s", env_key)
                 continue
 
-            section = key_path[0].lower()  # 'rag2f' or 'plugins'
-
-            # Validate section
-            if section not in ("rag2f", "plugins"):
+            # Validate section ('rag2f' or 'plugins')
+            if section not in sections:
                 logger.warning("Invalid section in env var %s: %s", env_key, section)
                 continue
 
-            # Parse and set the value
-            try:
-                parsed_value = self._parse_env_value(env_value)
-                self._set_nested_value(section, key_path[1:], parsed_value)
-                logger.debug("Set from env: %s = %s", env_key, parsed_value)
-            except Exception as e:
-                logger.error("Error processing env var %s: %s", env_key, e)
+            # For plugins section, first key is plugin_id: [plugin_id, key, subkey]
+            if section == "plugins" and len(path) < 2:
+                logger.warning("Plugin env var too short: %s", path)
+                continue
+
+            entries.append((section, path, env_key, parse_value(env_value)))
+
+        entries.sort(key=lambda entry: (entry[0], entry[1][0]))
+        return entries
 
     def _parse_env_value(self, value: str) -> Any:
         """Parse environment variable value with type inference.
 
         Attempts to parse as JSON first, falls back to string.
         """
+        # Plain strings (endpoints, keys, model names) cannot be JSON: skip the
+        # parse attempt and the exception it would raise
+        if not value or value[0] not in self._JSON_FIRST_CHARS:
+            return value
+
         # Try to parse as JSON (handles numbers, booleans, null, arrays, objects)
         try:
-            return json.loads(value)
+            return _json_loads(value)
         except (json.JSONDecodeError, ValueError):
             # Return as string
             return value
 
-    def _set_nested_value(self, section: str, path: list[str], value: Any) -> None:
+    @staticmethod
+    def _set_nested_value(target: dict[str, Any], path: list[str], value: Any) -> None:
         """Set a value in nested configuration structure.
 
         Args:
-            section: Top-level section ('rag2f' or 'plugins')
-            path: List of keys representing the path to the value
+            target: Dict the path is relative to (a section or a plugin config)
+            path: List of lowercase keys representing the path to the value
             value: Value to set
         """
-        if section == "rag2f":
-            # For rag2f section, path is direct: [EMBEDDER_DEFAULT] -> embedder_default
-            target = self._config["rag2f"]
-            for key in path[:-1]:
-                key_lower = key.lower()
-                if key_lower not in target:
-                    target[key_lower] = {}
-                target = target[key_lower]
-            target[path[-1].lower()] = value
-
-        elif section == "plugins":
-            # For plugins section, first key is plugin_id: [PLUGIN_ID, KEY, SUBKEY]
-            if len(path) < 2:
-                logger.warning("Plugin env var too short: %s", path)
-                return
-
-            plugin_id = path[0].lower()
-            if plugin_id not in self._config["plugins"]:
-                self._config["plugins"][plugin_id] = {}
-
-            target = self._config["plugins"][plugin_id]
-            for key in path[1:-1]:
-                key_lower = key.lower()
-                if key_lower not in target:
-                    target[key_lower] = {}
-                target = target[key_lower]
-            target[path[-1].lower()] = value
-
-    def get_rag2f_config(self, key: str | None = None, default: Any = None) -> Any:
+        for key in path[:-1]:
+            target = target.setdefault(key, {})
+        target[path[-1]] = value
+
+    def _view(self, cache_key: Any, source: dict[str, Any]) -> MappingProxyType:
+        """Return a cached read-only view over `source` for the current snapshot."""
+        if self._views_version != self._snapshot_version:
+            self._views = {}
+            self._views_version = self._snapshot_version
+        view = self._views.get(cache_key)
+        if view is None:
+            view = self._views[cache_key] = MappingProxyType(source)
+        return view
+
+    def get_rag2f_config(
+        self, key: str | None = None, default: Any = None, *, copy: bool = False
+    ) -> Any:
         """Get RAG2F core configuration.
 
         Args:
             key: Specific configuration key. If None, returns entire rag2f config.
             default: Default value if key not found.
+            copy: When returning the entire config, return a mutable deep copy
+                instead of a read-only view.
 
         Returns:
             Configuration value or default.
@@ -247,19 +383,24 @@ class Spock:
             self.load()
 
         if key is None:
-            return deepcopy(self._config.get("rag2f", {}))
+            if copy:
+                return _json_deepcopy(self._config["rag2f"])
+            return self._view("rag2f", self._config["rag2f"])
 
-        return self._config.get("rag2f", {}).get(key, default)
+        return self._config["rag2f"].get(key, default)
 
     def get_plugin_config(
-        self, plugin_id: str, key: str | None = None, default: Any = None
+        self, plugin_id: str, key: str | None = None, default: Any = None, *, copy: bool = False
     ) -> Any:
         """Get plugin-specific configuration.
 
         Args:
-            plugin_id: Plugin identifier
+            plugin_id: Plugin identifier. Falls back to the lowercase id, under
+                which environment overrides are stored.
             key: Specific configuration key. If None, returns entire plugin config.
             default: Default value if key not found.
+            copy: When returning the entire config, return a mutable deep copy
+                instead of a read-only view.
 
         Returns:
             Configuration value or default.
@@ -267,10 +408,15 @@ class Spock:
         if not self._loaded:
             self.load()
 
-        plugin_config = self._config.get("plugins", {}).get(plugin_id, {})
+        plugins = self._config["plugins"]
+        if plugin_id not in plugins:
+            plugin_id = plugin_id.lower()
+        plugin_config = plugins.get(plugin_id, {})
 
         if key is None:
-            return deepcopy(plugin_config)
+            if copy:
+                return _json_deepcopy(plugin_config)
+            return self._view(("plugins", plugin_id), plugin_config)
 
         return plugin_config.get(key, default)
 
@@ -285,6 +431,7 @@ class Spock:
             self.load()
 
         self._config["rag2f"][key] = value
+        self._snapshot_version += 1
         logger.debug("Set rag2f config: %s = %s", key, value)
 
     def set_plugin_config(self, plugin_id: str, key: str, value: Any) -> None:
@@ -298,28 +445,48 @@ class Spock:
         if not self._loaded:
             self.load()
 
-        if plugin_id not in self._config["plugins"]:
-            self._config["plugins"][plugin_id] = {}
-
-        self._config["plugins"][plugin_id][key] = value
+        self._config["plugins"].setdefault(plugin_id, {})[key] = value
+        self._snapshot_version += 1
         logger.debug("Set plugin config: %s.%s = %s", plugin_id, key, value)
 
-    def get_all_config(self) -> dict[str, Any]:
+    def get_all_config(self, *, copy: bool = False) -> Mapping[str, Any]:
         """Get complete configuration snapshot.
 
+        Args:
+            copy: Return a mutable deep copy instead of a read-only view.
+
         Returns:
-            Deep copy of entire configuration.
+            Read-only view of the entire configuration, or a deep copy of it.
         """
         if not self._loaded:
             self.load()
 
-        return deepcopy(self._config)
+        if copy:
+            return _json_deepcopy(self._config)
+        return self._view(None, self._config)
 
-    def reload(self) -> None:
+    def reload(self, *, force: bool = False) -> None:
         """Reload configuration from sources.
 
-        Useful for picking up configuration changes at runtime.
+        Useful for picking up configuration changes at runtime. Skipped when the
+        JSON file and RAG2F environment variables are unchanged since the last
+        load and no runtime setter has been used. In-place changes to values
+        returned by the getters are not tracked, so pass force=True to restore
+        the source values after such changes.
+
+        Args:
+            force: Always reload, even when the sources look unchanged.
         """
+        if (
+            not force
+            and self._loaded
+            and self._source_fingerprint is not None
+            and self._loaded_version == self._snapshot_version
+            and self._source_fingerprint == (self._file_fingerprint(), self._env_items())
+        ):
+            logger.debug("Configuration sources unchanged, skipping reload")
+            return
+
         self._loaded = False
         self.load()
         logger.info("Configuration reloaded")
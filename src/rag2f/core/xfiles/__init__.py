@@ -100,6 +100,7 @@ from rag2f.core.xfiles.repository import (
     QueryableRepository,
     RepositoryNativeMixin,
     VectorSearchRepository,
+    implements_protocol,
 )
 
 # =============================================================================
@@ -140,6 +141,8 @@ from rag2f.core.xfiles.validation import (
     ARITY_2_UNARY,
     ARITY_3_COMPARISON,
     ARITY_3_LOGICAL,
+    MAX_WHERE_DEPTH,
+    MAX_WHERE_NODES,
     get_expected_arity,
     validate_queryspec,
 )
@@ -165,6 +168,7 @@ __all__ = [
     "GraphTraversalRepository",
     "RepositoryNativeMixin",
     "AnyRepository",
+    "implements_protocol",
     # Exceptions
     "RepositoryError",
     "NotFound",
@@ -215,4 +219,6 @@ __all__ = [
     "ARITY_2_UNARY",
     "ARITY_3_COMPARISON",
     "ARITY_3_LOGICAL",
+    "MAX_WHERE_DEPTH",
+    "MAX_WHERE_NODES",
 ]
@@ -4,9 +4,27 @@ Defines the capability structure for repository plugins to declare
 what features they support and how (pushdown vs fallback).
 """
 
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any, Literal
 
+# Shared read-only empty mapping: missing from_dict sections and the default 'extra'
+_EMPTY_SECTION: Mapping[str, Any] = MappingProxyType({})
+
+
+def _as_tuple(value: Any, default: tuple[str, ...]) -> tuple[str, ...]:
+    """Coerce a list/tuple field from from_dict input, or return the default."""
+    # exact types first: JSON input is a list, re-serialized capabilities a tuple
+    t = type(value)
+    if t is tuple:
+        return value
+    if t is list or isinstance(value, (list, tuple)):
+        return tuple(value)
+    return default
+
+
 # =============================================================================
 # CAPABILITY FEATURE DESCRIPTORS
 # =============================================================================
@@ -63,6 +81,15 @@ class FilterCapability:
     supported: bool = False
     pushdown: bool = False
     ops: tuple[str, ...] = field(default_factory=tuple)
+    # Set view of ``ops`` for O(1) membership checks; ``ops`` keeps declaration order.
+    _op_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_op_set", frozenset(self.ops))
+
+    def supports_operator(self, op: str) -> bool:
+        """Check if filtering is available and `op` is a declared operator."""
+        return self.supported and op in self._op_set
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the filter capability to a JSON-serializable dictionary.
@@ -73,7 +100,7 @@ class FilterCapability:
         return {
             "supported": self.supported,
             "pushdown": self.pushdown,
-            "ops": list(self.ops),
+            "ops": [*self.ops],
         }
 
     @classmethod
@@ -86,11 +113,13 @@ class FilterCapability:
         Returns:
             A FilterCapability instance.
         """
-        ops = data.get("ops", [])
+        # Intern decoded operator names so they share storage (and identity) with
+        # the literals used by validators and hand-written capabilities.
+        ops = _as_tuple(data.get("ops", []), ())
         return cls(
             supported=data.get("supported", False),
             pushdown=data.get("pushdown", False),
-            ops=tuple(ops) if isinstance(ops, (list, tuple)) else tuple(),
+            ops=tuple([sys.intern(op) if type(op) is str else op for op in ops]),
         )
 
 
@@ -159,6 +188,11 @@ class NativeCapability:
 
     supported: bool = False
     kinds: tuple[str, ...] = field(default_factory=lambda: ("primary",))
+    # Set view of ``kinds`` for O(1) membership checks.
+    _kind_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_kind_set", frozenset(self.kinds))
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the native capability to a JSON-serializable dictionary.
@@ -168,7 +202,7 @@ class NativeCapability:
         """
         return {
             "supported": self.supported,
-            "kinds": list(self.kinds),
+            "kinds": [*self.kinds],
         }
 
     @classmethod
@@ -184,7 +218,7 @@ class NativeCapability:
         kinds = data.get("kinds", ["primary"])
         return cls(
             supported=data.get("supported", False),
-            kinds=tuple(kinds) if isinstance(kinds, (list, tuple)) else ("primary",),
+            kinds=_as_tuple(kinds, ("primary",)),
         )
 
 
@@ -245,7 +279,7 @@ class UpdateCapability:
         return {
             "dot_notation": self.dot_notation,
             "deep_merge": self.deep_merge,
-            "atomic_ops": list(self.atomic_ops),
+            "atomic_ops": [*self.atomic_ops],
         }
 
     @classmethod
@@ -262,7 +296,7 @@ class UpdateCapability:
         return cls(
             dot_notation=data.get("dot_notation", False),
             deep_merge=data.get("deep_merge", False),
-            atomic_ops=tuple(ops) if isinstance(ops, (list, tuple)) else tuple(),
+            atomic_ops=_as_tuple(ops, ()),
         )
 
 
@@ -289,7 +323,7 @@ class VectorSearchCapability:
         result: dict[str, Any] = {"supported": self.supported}
         if self.dimensions is not None:
             result["dimensions"] = self.dimensions
-        result["distance_metrics"] = list(self.distance_metrics)
+        result["distance_metrics"] = [*self.distance_metrics]
         return result
 
     @classmethod
@@ -306,7 +340,7 @@ class VectorSearchCapability:
         return cls(
             supported=data.get("supported", False),
             dimensions=data.get("dimensions"),
-            distance_metrics=tuple(metrics) if isinstance(metrics, (list, tuple)) else ("cosine",),
+            distance_metrics=_as_tuple(metrics, ("cosine",)),
         )
 
 
@@ -375,7 +409,8 @@ class Capabilities:
         native: Native escape hatch capability.
         vector_search: Vector search capability (optional interface).
         graph_traversal: Graph traversal capability (optional interface).
-        extra: Additional plugin-specific capabilities.
+        extra: Additional plugin-specific capabilities (read-only empty mapping
+            by default).
 
     Example:
         >>> caps = Capabilities(
@@ -406,7 +441,7 @@ class Capabilities:
     native: NativeCapability = field(default_factory=NativeCapability)
     vector_search: VectorSearchCapability = field(default_factory=VectorSearchCapability)
     graph_traversal: GraphTraversalCapability = field(default_factory=GraphTraversalCapability)
-    extra: dict[str, Any] = field(default_factory=dict)
+    extra: Mapping[str, Any] = _EMPTY_SECTION
 
     def to_dict(self) -> dict[str, Any]:
         """Convert capabilities to dictionary representation."""
@@ -422,25 +457,30 @@ class Capabilities:
             "vector_search": self.vector_search.to_dict(),
             "graph_traversal": self.graph_traversal.to_dict(),
         }
-        if self.extra:
-            result["extra"] = self.extra
+        extra = self.extra
+        if extra is not _EMPTY_SECTION and extra:
+            result["extra"] = dict(extra)
         return result
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Capabilities":
         """Create Capabilities from dictionary representation."""
+        # Missing sections share one read-only empty mapping instead of a new {}
+        get = data.get
+        empty = _EMPTY_SECTION
+        feature_from_dict = FeatureSupport.from_dict
         return cls(
-            crud=data.get("crud", True),
-            query=QueryCapability.from_dict(data.get("query", {})),
-            projection=FeatureSupport.from_dict(data.get("projection", {})),
-            filter=FilterCapability.from_dict(data.get("filter", {})),
-            order_by=FeatureSupport.from_dict(data.get("order_by", {})),
-            pagination=PaginationCapability.from_dict(data.get("pagination", {})),
-            update=UpdateCapability.from_dict(data.get("update", {})),
-            native=NativeCapability.from_dict(data.get("native", {})),
-            vector_search=VectorSearchCapability.from_dict(data.get("vector_search", {})),
-            graph_traversal=GraphTraversalCapability.from_dict(data.get("graph_traversal", {})),
-            extra=data.get("extra", {}),
+            crud=get("crud", True),
+            query=QueryCapability.from_dict(get("query", empty)),
+            projection=feature_from_dict(get("projection", empty)),
+            filter=FilterCapability.from_dict(get("filter", empty)),
+            order_by=feature_from_dict(get("order_by", empty)),
+            pagination=PaginationCapability.from_dict(get("pagination", empty)),
+            update=UpdateCapability.from_dict(get("update", empty)),
+            native=NativeCapability.from_dict(get("native", empty)),
+            vector_search=VectorSearchCapability.from_dict(get("vector_search", empty)),
+            graph_traversal=GraphTraversalCapability.from_dict(get("graph_traversal", empty)),
+            extra=get("extra", empty),
         )
 
     def supports_operator(self, op: str) -> bool:
@@ -452,7 +492,7 @@ class Capabilities:
         Returns:
             True if the operator is in the supported ops list.
         """
-        return self.filter.supported and op in self.filter.ops
+        return self.filter.supported and op in self.filter._op_set
 
     def supports_native_kind(self, kind: str) -> bool:
         """Check if a native handle kind is supported.
@@ -463,7 +503,7 @@ class Capabilities:
         Returns:
             True if the kind is available.
         """
-        return self.native.supported and kind in self.native.kinds
+        return self.native.supported and kind in self.native._kind_set
 
 
 # =============================================================================
@@ -471,17 +511,21 @@ class Capabilities:
 # =============================================================================
 
 
+_DEFAULT_FILTER_OPS = ("eq", "ne", "gt", "gte", "lt", "lte", "in", "and", "or", "not")
+
+
 def minimal_crud_capabilities() -> Capabilities:
     """Create minimal capabilities for a CRUD-only repository.
 
     Returns:
-        Capabilities with only CRUD enabled.
+        Capabilities with only CRUD enabled. The instance is shared between
+        calls; use dataclasses.replace() to derive a customized copy.
     """
-    return Capabilities(crud=True)
+    return _MINIMAL_CRUD
 
 
 def standard_queryable_capabilities(
-    filter_ops: tuple[str, ...] = ("eq", "ne", "gt", "gte", "lt", "lte", "in", "and", "or", "not"),
+    filter_ops: tuple[str, ...] = _DEFAULT_FILTER_OPS,
     max_limit: int = 1000,
     pushdown: bool = False,
 ) -> Capabilities:
@@ -499,7 +543,17 @@ def standard_queryable_capabilities(
 
     Returns:
         Capabilities with CRUD, query, projection, filter, order_by, pagination.
+        Calls with the default arguments share one instance.
     """
+    if not pushdown and max_limit == 1000 and filter_ops == _DEFAULT_FILTER_OPS:
+        return _STANDARD_QUERYABLE
+    return _build_standard_queryable(filter_ops, max_limit, pushdown)
+
+
+def _build_standard_queryable(
+    filter_ops: tuple[str, ...], max_limit: int, pushdown: bool
+) -> Capabilities:
+    """Build a new Capabilities tree for standard_queryable_capabilities()."""
     return Capabilities(
         crud=True,
         query=QueryCapability(supported=True),
@@ -516,6 +570,11 @@ def standard_queryable_capabilities(
     )
 
 
+# Shared default instances (immutable, including their empty 'extra')
+_MINIMAL_CRUD = Capabilities(crud=True)
+_STANDARD_QUERYABLE = _build_standard_queryable(_DEFAULT_FILTER_OPS, 1000, False)
+
+
 __all__ = [
     # Feature descriptors
     "FeatureSupport",
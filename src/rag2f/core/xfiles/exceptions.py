@@ -4,13 +4,51 @@ Custom exceptions for repository operations, providing clear error
 semantics for CRUD, query validation, and backend interactions.
 """
 
+import copyreg
 from typing import Any
 
 
 class RepositoryError(Exception):
-    """Base exception for all repository-related errors."""
+    """Base exception for all repository-related errors.
 
-    pass
+    Subclasses store their fields in __slots__. Pickling carries them as state
+    (BaseException only preserves args and __dict__) and rebuilds instances
+    without calling __init__ again, which would re-format the message.
+
+    Subclasses with structured fields build their message lazily in
+    _format_message(), so raising and immediately catching one (e.g. probing
+    with AlreadyExists) never pays for the repr() of ids and values. str(),
+    repr() and args all expose the formatted message as before.
+    """
+
+    def _format_message(self) -> str | None:
+        """Return the message built from the fields, or None to use args."""
+        return None
+
+    @property
+    def args(self) -> tuple[Any, ...]:
+        message = self._format_message()
+        return BaseException.args.__get__(self) if message is None else (message,)
+
+    @args.setter
+    def args(self, value: tuple[Any, ...]) -> None:
+        BaseException.args.__set__(self, value)
+
+    def __str__(self) -> str:
+        message = self._format_message()
+        return super().__str__() if message is None else message
+
+    def __repr__(self) -> str:
+        message = self._format_message()
+        return super().__repr__() if message is None else f"{type(self).__name__}({message!r})"
+
+    def __reduce__(self):
+        state = dict(getattr(self, "__dict__", None) or {})
+        for klass in type(self).__mro__:
+            for name in klass.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return (copyreg.__newobj__, (type(self), *self.args), state or None)
 
 
 class NotFound(RepositoryError):
@@ -21,6 +59,8 @@ class NotFound(RepositoryError):
         repository: Optional name of the repository.
     """
 
+    __slots__ = ("id", "repository")
+
     def __init__(self, id: Any, repository: str | None = None):
         """Initialize NotFound.
 
@@ -28,10 +68,13 @@ class NotFound(RepositoryError):
             id: The identifier of the missing document.
             repository: Optional name of the repository.
         """
+        super().__init__()
         self.id = id
         self.repository = repository
-        repo_info = f" in repository '{repository}'" if repository else ""
-        super().__init__(f"Document with id={id!r} not found{repo_info}.")
+
+    def _format_message(self) -> str:
+        repo_info = f" in repository '{self.repository}'" if self.repository else ""
+        return f"Document with id={self.id!r} not found{repo_info}."
 
 
 class AlreadyExists(RepositoryError):
@@ -42,6 +85,8 @@ class AlreadyExists(RepositoryError):
         repository: Optional name of the repository.
     """
 
+    __slots__ = ("id", "repository")
+
     def __init__(self, id: Any, repository: str | None = None):
         """Initialize AlreadyExists.
 
@@ -49,10 +94,13 @@ class AlreadyExists(RepositoryError):
             id: The identifier of the document that already exists.
             repository: Optional name of the repository.
         """
+        super().__init__()
         self.id = id
         self.repository = repository
-        repo_info = f" in repository '{repository}'" if repository else ""
-        super().__init__(f"Document with id={id!r} already exists{repo_info}.")
+
+    def _format_message(self) -> str:
+        repo_info = f" in repository '{self.repository}'" if self.repository else ""
+        return f"Document with id={self.id!r} already exists{repo_info}."
 
 
 class NotSupported(RepositoryError):
@@ -69,6 +117,8 @@ class NotSupported(RepositoryError):
         details: Optional additional context.
     """
 
+    __slots__ = ("feature", "repository", "details")
+
     def __init__(
         self,
         feature: str,
@@ -82,13 +132,15 @@ class NotSupported(RepositoryError):
             repository: Optional name of the repository.
             details: Optional extra details.
         """
+        super().__init__()
         self.feature = feature
         self.repository = repository
         self.details = details
 
-        repo_info = f" in repository '{repository}'" if repository else ""
-        detail_info = f": {details}" if details else ""
-        super().__init__(f"Feature '{feature}' is not supported{repo_info}{detail_info}.")
+    def _format_message(self) -> str:
+        repo_info = f" in repository '{self.repository}'" if self.repository else ""
+        detail_info = f": {self.details}" if self.details else ""
+        return f"Feature '{self.feature}' is not supported{repo_info}{detail_info}."
 
 
 class ValidationError(RepositoryError):
@@ -106,6 +158,8 @@ class ValidationError(RepositoryError):
         value: Optional value that failed validation.
     """
 
+    __slots__ = ("details", "field", "value")
+
     def __init__(
         self,
         details: str,
@@ -119,13 +173,15 @@ class ValidationError(RepositoryError):
             field: Optional field name associated with the error.
             value: Optional invalid value.
         """
+        super().__init__()
         self.details = details
         self.field = field
         self.value = value
 
-        field_info = f" (field={field!r})" if field else ""
-        value_info = f" [value={value!r}]" if value is not None else ""
-        super().__init__(f"Validation error{field_info}: {details}{value_info}")
+    def _format_message(self) -> str:
+        field_info = f" (field={self.field!r})" if self.field else ""
+        value_info = f" [value={self.value!r}]" if self.value is not None else ""
+        return f"Validation error{field_info}: {self.details}{value_info}"
 
 
 class BackendError(RepositoryError):
@@ -139,6 +195,8 @@ class BackendError(RepositoryError):
         cause: Optional original exception from the backend.
     """
 
+    __slots__ = ("details", "cause")
+
     def __init__(
         self,
         details: str,
@@ -150,15 +208,18 @@ class BackendError(RepositoryError):
             details: Description of the backend error.
             cause: Optional original exception from the backend.
         """
+        super().__init__()
         self.details = details
         self.cause = cause
 
-        cause_info = f" (caused by: {type(cause).__name__}: {cause})" if cause else ""
-        super().__init__(f"Backend error: {details}{cause_info}")
-
         if cause:
             self.__cause__ = cause
 
+    def _format_message(self) -> str:
+        cause = self.cause
+        cause_info = f" (caused by: {type(cause).__name__}: {cause})" if cause else ""
+        return f"Backend error: {self.details}{cause_info}"
+
 
 __all__ = [
     "RepositoryError",
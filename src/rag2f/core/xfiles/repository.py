@@ -18,6 +18,7 @@ from typing import (
     TypeVar,
     runtime_checkable,
 )
+from weakref import WeakKeyDictionary
 
 from rag2f.core.xfiles.capabilities import Capabilities
 from rag2f.core.xfiles.exceptions import NotSupported
@@ -222,7 +223,7 @@ class RepositoryNativeMixin:
             raise NotSupported(
                 "native", details="Native access is not supported by this repository"
             )
-        if kind not in caps.native.kinds:
+        if not caps.supports_native_kind(kind):
             available = ", ".join(caps.native.kinds) or "none"
             raise NotSupported(
                 f"native:{kind}",
@@ -267,18 +268,11 @@ class RepositoryNativeMixin:
         """
         handle = self.native(kind)
 
-        # Check compatibility
-        if callable(type_or_protocol) and not isinstance(type_or_protocol, type):
-            # It's a callable checker
-            if not type_or_protocol(handle):
-                raise NotSupported(
-                    f"native:{kind}",
-                    details=f"Native handle failed compatibility check with {type_or_protocol}",
-                )
-        elif isinstance(type_or_protocol, type):
+        # Check compatibility: classify the checker once, then take one branch
+        if isinstance(type_or_protocol, type):
             # It's a class or Protocol (potentially runtime_checkable)
             try:
-                if not isinstance(handle, type_or_protocol):
+                if not implements_protocol(handle, type_or_protocol):
                     raise NotSupported(
                         f"native:{kind}",
                         details=(
@@ -295,6 +289,13 @@ class RepositoryNativeMixin:
                         "If using a Protocol, add the @runtime_checkable decorator."
                     ),
                 ) from e
+        elif callable(type_or_protocol):
+            # It's a callable checker
+            if not type_or_protocol(handle):
+                raise NotSupported(
+                    f"native:{kind}",
+                    details=f"Native handle failed compatibility check with {type_or_protocol}",
+                )
         else:
             # Fallback: try isinstance anyway
             try:
@@ -477,6 +478,48 @@ class GraphTraversalRepository(BaseRepository, Protocol):
         ...
 
 
+# =============================================================================
+# PROTOCOL CONFORMANCE
+# =============================================================================
+
+# concrete type -> protocols it is known to satisfy at class level; weak keys so
+# dynamic classes can be collected
+_CONFORMANCE_CACHE: WeakKeyDictionary[type, set[type]] = WeakKeyDictionary()
+
+
+def implements_protocol(obj: object, protocol: type) -> bool:
+    """Check isinstance(obj, protocol), caching positive answers per concrete type.
+
+    isinstance() against a runtime_checkable Protocol probes every protocol
+    member on each call. A match is remembered for type(obj) only when the
+    class itself defines every protocol member (or protocol is a regular
+    class); objects that conform through per-instance attributes, and
+    non-matches, are always checked in full.
+
+    Args:
+        obj: The object to check (typically a repository instance).
+        protocol: A runtime_checkable Protocol or a regular class.
+
+    Returns:
+        True if obj is compatible with protocol.
+
+    Raises:
+        TypeError: If protocol is not runtime_checkable (as isinstance() does).
+    """
+    cls = type(obj)
+    known = _CONFORMANCE_CACHE.get(cls)
+    if known is not None and protocol in known:
+        return True
+    if not isinstance(obj, protocol):
+        return False
+    members = getattr(protocol, "__protocol_attrs__", ())
+    if all(hasattr(cls, name) for name in members):
+        if known is None:
+            known = _CONFORMANCE_CACHE[cls] = set()
+        known.add(protocol)
+    return True
+
+
 # =============================================================================
 # TYPE ALIASES FOR CONVENIENCE
 # =============================================================================
@@ -495,6 +538,8 @@ __all__ = [
     "GraphTraversalRepository",
     # Mixin for native support
     "RepositoryNativeMixin",
+    # Cached protocol checks
+    "implements_protocol",
     # Type aliases
     "AnyRepository",
 ]
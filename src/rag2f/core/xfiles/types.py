@@ -121,6 +121,20 @@ class QuerySpec:
             result["limit"] = self.limit
         return result
 
+    def normalized_order_by(self) -> tuple[tuple[str, bool], ...]:
+        """Split order_by entries into (field, descending) pairs.
+
+        Gives backends one canonical parse of the "-" prefix, matching the
+        field names checked by validate_queryspec().
+
+        Returns:
+            Tuple of (field_name, descending) pairs, empty if order_by is None.
+            Example: ["-created_at", "name"] -> (("created_at", True), ("name", False))
+        """
+        if not self.order_by:
+            return ()
+        return tuple([(f.lstrip("-"), f.startswith("-")) for f in self.order_by])
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "QuerySpec":
         """Create QuerySpec from dictionary.
@@ -189,6 +203,22 @@ def in_(field: str, values: list[Any]) -> WhereNode:
     return ("in", field, list(values))
 
 
+def _fold_balanced(op: str, conditions: tuple[WhereNode, ...]) -> WhereNode:
+    """Fold conditions into a balanced tree of binary `op` nodes.
+
+    Adjacent conditions are paired level by level, so n conditions give a
+    depth of ceil(log2(n)) instead of n - 1, while the left-to-right order of
+    the leaves is preserved.
+    """
+    level = list(conditions)
+    while len(level) > 1:
+        paired = [(op, level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
 def and_(*conditions: WhereNode) -> WhereNode:
     """Combine conditions with AND.
 
@@ -196,14 +226,11 @@ def and_(*conditions: WhereNode) -> WhereNode:
         *conditions: Two or more WhereNode conditions.
 
     Returns:
-        Combined WhereNode with AND logic.
+        Combined WhereNode with AND logic, as a balanced tree of binary nodes.
     """
     if len(conditions) < 2:
         raise ValueError("and_ requires at least 2 conditions")
-    result = conditions[0]
-    for cond in conditions[1:]:
-        result = ("and", result, cond)
-    return result
+    return _fold_balanced("and", conditions)
 
 
 def or_(*conditions: WhereNode) -> WhereNode:
@@ -213,14 +240,11 @@ def or_(*conditions: WhereNode) -> WhereNode:
         *conditions: Two or more WhereNode conditions.
 
     Returns:
-        Combined WhereNode with OR logic.
+        Combined WhereNode with OR logic, as a balanced tree of binary nodes.
     """
     if len(conditions) < 2:
         raise ValueError("or_ requires at least 2 conditions")
-    result = conditions[0]
-    for cond in conditions[1:]:
-        result = ("or", result, cond)
-    return result
+    return _fold_balanced("or", conditions)
 
 
 def not_(condition: WhereNode) -> WhereNode:
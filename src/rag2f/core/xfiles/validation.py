@@ -10,7 +10,9 @@ This module catches invalid queries early, preventing silent bugs and
 ensuring consistent behavior across different repository plugins.
 """
 
-from rag2f.core.xfiles.capabilities import Capabilities
+from typing import NoReturn
+
+from rag2f.core.xfiles.capabilities import Capabilities, FilterCapability
 from rag2f.core.xfiles.exceptions import NotSupported, ValidationError
 from rag2f.core.xfiles.types import QuerySpec, WhereNode
 
@@ -57,6 +59,33 @@ ARITY_3_LOGICAL: frozenset[str] = frozenset(
 # All known operators for reference
 ALL_KNOWN_OPS: frozenset[str] = ARITY_3_COMPARISON | ARITY_2_UNARY | ARITY_3_LOGICAL
 
+# Single-probe lookup tables derived from the sets above: operator -> arity,
+# and operator -> node kind (which branch of the validator handles it)
+_OP_ARITY: dict[str, int] = {
+    **dict.fromkeys(ARITY_3_COMPARISON, 3),
+    **dict.fromkeys(ARITY_2_UNARY, 2),
+    **dict.fromkeys(ARITY_3_LOGICAL, 3),
+}
+
+_KIND_COMPARISON = 0
+_KIND_EXISTS = 1
+_KIND_NOT = 2
+_KIND_LOGICAL = 3
+
+_OP_KIND: dict[str, int] = {
+    **dict.fromkeys(ARITY_3_COMPARISON, _KIND_COMPARISON),
+    "exists": _KIND_EXISTS,
+    "not": _KIND_NOT,
+    **dict.fromkeys(ARITY_3_LOGICAL, _KIND_LOGICAL),
+}
+
+
+# Budget for a single where clause: nesting depth and total node count. The
+# and_()/or_() builders fold n conditions to depth ~log2(n), so these only
+# reject hand-built pathological trees.
+MAX_WHERE_DEPTH = 256
+MAX_WHERE_NODES = 4096
+
 
 def get_expected_arity(op: str) -> int:
     """Get the expected arity (tuple length) for an operator.
@@ -68,11 +97,7 @@ def get_expected_arity(op: str) -> int:
         Expected tuple length (including the operator itself).
         Returns 0 if operator is unknown.
     """
-    if op in ARITY_3_COMPARISON or op in ARITY_3_LOGICAL:
-        return 3
-    if op in ARITY_2_UNARY:
-        return 2
-    return 0  # Unknown operator
+    return _OP_ARITY.get(op, 0)  # 0 = unknown operator
 
 
 # =============================================================================
@@ -80,23 +105,38 @@ def get_expected_arity(op: str) -> int:
 # =============================================================================
 
 
-def _validate_where_node(
-    node: WhereNode,
-    caps: Capabilities,
-    allowed_fields: set[str] | None = None,
-    path: str = "where",
-) -> None:
-    """Recursively validate a WhereNode AST.
+def _raise_field_not_str(path: str, field_name: object) -> NoReturn:
+    """Raise the error for a non-string field name at node `path`."""
+    raise ValidationError(
+        f"Field name must be a string, got {type(field_name).__name__}",
+        field=f"{path}[1]",
+        value=field_name,
+    )
 
-    Args:
-        node: WhereNode tuple to validate.
-        caps: Repository capabilities.
-        allowed_fields: Optional set of allowed field names. If None, all fields allowed.
-        path: Current path in AST for error messages.
 
-    Raises:
-        ValidationError: If node structure is invalid (wrong arity, invalid type).
-        NotSupported: If operator is not supported by capabilities.
+def _raise_field_not_allowed(path: str, field_name: str) -> NoReturn:
+    """Raise the error for a field outside the allowlist at node `path`."""
+    raise ValidationError(
+        f"Field '{field_name}' is not in allowed fields",
+        field=f"{path}[1]",
+        value=field_name,
+    )
+
+
+def _raise_op_not_supported(op: str, filter_caps: FilterCapability) -> NoReturn:
+    """Raise the error for an operator missing from the filter capability."""
+    raise NotSupported(
+        feature=f"filter operator '{op}'",
+        details=f"Supported operators: {', '.join(filter_caps.ops)}",
+    )
+
+
+def _check_node_structure(node: object, path: str, filter_caps: FilterCapability) -> str:
+    """Run the full structural checks on a node, in diagnostic order.
+
+    Used when a node misses the validator's fast path: raises the first
+    applicable error, or returns the operator for valid nodes built from
+    tuple/str subclasses.
     """
     # Check basic tuple structure
     if not isinstance(node, tuple):
@@ -124,14 +164,11 @@ def _validate_where_node(
         )
 
     # Check operator is supported by capabilities
-    if caps.filter.supported and op not in caps.filter.ops:
-        raise NotSupported(
-            feature=f"filter operator '{op}'",
-            details=f"Supported operators: {', '.join(caps.filter.ops)}",
-        )
+    if filter_caps.supported and not filter_caps.supports_operator(op):
+        _raise_op_not_supported(op, filter_caps)
 
     # Check arity
-    expected_arity = get_expected_arity(op)
+    expected_arity = _OP_ARITY.get(op, 0)
     if expected_arity == 0:
         raise ValidationError(
             f"Unknown operator '{op}'",
@@ -147,65 +184,114 @@ def _validate_where_node(
             value=node,
         )
 
-    # Validate based on operator type
-    if op in ARITY_3_COMPARISON:
-        # Format: (op, field, value)
-        field_name = node[1]
-        if not isinstance(field_name, str):
-            raise ValidationError(
-                f"Field name must be a string, got {type(field_name).__name__}",
-                field=f"{path}[1]",
-                value=field_name,
-            )
+    return op
 
-        # Check field allowlist
-        if allowed_fields is not None and field_name not in allowed_fields:
-            raise ValidationError(
-                f"Field '{field_name}' is not in allowed fields",
-                field=f"{path}[1]",
-                value=field_name,
-            )
 
-        # Validate 'in' operator: values must be a list (canonical form)
-        if op == "in":
-            values = node[2]
-            if not isinstance(values, list):
-                raise ValidationError(
-                    f"'in' operator values must be a list, got {type(values).__name__}. "
-                    "Use the in_() builder or provide a list for JSON compatibility.",
-                    field=f"{path}[2]",
-                    value=values,
-                )
-        # Other comparison operators: value can be any type
+def _validate_where_node(
+    node: WhereNode,
+    filter_caps: FilterCapability,
+    allowed_fields: set[str] | frozenset[str] | None = None,
+    path: str = "where",
+) -> None:
+    """Validate a WhereNode AST.
 
-    elif op == "exists":
-        # Format: (exists, field)
-        field_name = node[1]
-        if not isinstance(field_name, str):
-            raise ValidationError(
-                f"Field name must be a string, got {type(field_name).__name__}",
-                field=f"{path}[1]",
-                value=field_name,
-            )
+    The tree is walked iteratively (depth-first, left before right), so deep
+    and/or chains neither allocate a frame per node nor hit the recursion limit.
+    The walk is bounded by MAX_WHERE_DEPTH and MAX_WHERE_NODES, and callers
+    must not hash or compare the tree before it (both are O(n), and tuple
+    hashing recurses in C).
+
+    Args:
+        node: WhereNode tuple to validate.
+        filter_caps: Filter capability of the repository.
+        allowed_fields: Optional set of allowed field names. If None, all fields allowed.
+        path: Path of the root node in the query, for error messages.
 
-        if allowed_fields is not None and field_name not in allowed_fields:
+    Raises:
+        ValidationError: If node structure is invalid (wrong arity, invalid type)
+            or the tree exceeds the depth/node budget.
+        NotSupported: If operator is not supported by capabilities.
+    """
+    op_arity = _OP_ARITY
+    op_kind = _OP_KIND
+    filter_supported = filter_caps.supported
+    supports_operator = filter_caps.supports_operator
+
+    max_depth = MAX_WHERE_DEPTH
+    nodes_left = MAX_WHERE_NODES
+
+    stack: list[tuple[WhereNode, str, int]] = [(node, path, 1)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node, path, depth = pop()
+        nodes_left -= 1
+        if nodes_left < 0:
             raise ValidationError(
-                f"Field '{field_name}' is not in allowed fields",
-                field=f"{path}[1]",
-                value=field_name,
+                f"where AST too large (more than {MAX_WHERE_NODES} nodes)",
+                field="where",
             )
 
-    elif op == "not":
-        # Format: (not, condition)
-        condition = node[1]
-        _validate_where_node(condition, caps, allowed_fields, f"{path}.not")
-
-    elif op in ARITY_3_LOGICAL:
-        # Format: (and/or, left, right)
-        left = node[1]
-        right = node[2]
-        _validate_where_node(left, caps, allowed_fields, f"{path}.{op}.left")
-        _validate_where_node(right, caps, allowed_fields, f"{path}.{op}.right")
+        # Fast path: a well-formed node of a known operator only needs the
+        # capability check; anything else gets the full diagnostics.
+        if (
+            type(node) is tuple
+            and node
+            and type(op := node[0]) is str
+            and op_arity.get(op, 0) == len(node)
+        ):
+            if filter_supported and not supports_operator(op):
+                _raise_op_not_supported(op, filter_caps)
+        else:
+            op = _check_node_structure(node, path, filter_caps)
+
+        # Validate based on operator kind
+        kind = op_kind[op]
+        if kind == _KIND_COMPARISON:
+            # Format: (op, field, value)
+            field_name = node[1]
+            if not isinstance(field_name, str):
+                _raise_field_not_str(path, field_name)
+
+            # Check field allowlist
+            if allowed_fields is not None and field_name not in allowed_fields:
+                _raise_field_not_allowed(path, field_name)
+
+            # Validate 'in' operator: values must be a list (canonical form)
+            if op == "in":
+                values = node[2]
+                if not isinstance(values, list):
+                    raise ValidationError(
+                        f"'in' operator values must be a list, got {type(values).__name__}. "
+                        "Use the in_() builder or provide a list for JSON compatibility.",
+                        field=f"{path}[2]",
+                        value=values,
+                    )
+            # Other comparison operators: value can be any type
+
+        elif kind == _KIND_EXISTS:
+            # Format: (exists, field)
+            field_name = node[1]
+            if not isinstance(field_name, str):
+                _raise_field_not_str(path, field_name)
+
+            if allowed_fields is not None and field_name not in allowed_fields:
+                _raise_field_not_allowed(path, field_name)
+
+        else:
+            if depth >= max_depth:
+                raise ValidationError(
+                    f"where AST too deep (more than {max_depth} levels)",
+                    field="where",
+                )
+            depth += 1
+            if kind == _KIND_NOT:
+                # Format: (not, condition)
+                push((node[1], f"{path}.not", depth))
+            else:
+                # Format: (and/or, left, right); push right first so left is checked first
+                push((node[2], f"{path}.{op}.right", depth))
+                push((node[1], f"{path}.{op}.left", depth))
 
 
 # =============================================================================
@@ -217,9 +303,9 @@ def validate_queryspec(
     query: QuerySpec,
     caps: Capabilities,
     *,
-    allowed_fields: set[str] | None = None,
-    allowed_select: set[str] | None = None,
-    allowed_order_by: set[str] | None = None,
+    allowed_fields: set[str] | frozenset[str] | None = None,
+    allowed_select: set[str] | frozenset[str] | None = None,
+    allowed_order_by: set[str] | frozenset[str] | None = None,
 ) -> QuerySpec:
     """Validate a QuerySpec against repository capabilities and field allowlists.
 
@@ -258,13 +344,18 @@ def validate_queryspec(
         >>> query = QuerySpec(where=("eq", "name", "Alice"), limit=100)
         >>> validated = validate_queryspec(query, caps)
     """
-    # Start with original query values
-    result_limit = query.limit
+    # Read each QuerySpec field once; every section below works on these locals
+    select = query.select
+    where = query.where
+    order_by = query.order_by
+    limit = query.limit
+    offset = query.offset
+    result_limit = limit
 
     # ---------------------------------------------------------------------------
     # Validate query capability
     # ---------------------------------------------------------------------------
-    if query.where is not None and not caps.query.supported:
+    if where is not None and not caps.query.supported:
         raise NotSupported(
             feature="query",
             details="Repository does not support queries (find operations)",
@@ -273,14 +364,14 @@ def validate_queryspec(
     # ---------------------------------------------------------------------------
     # Validate projection (select)
     # ---------------------------------------------------------------------------
-    if query.select is not None:
+    if select is not None:
         if not caps.projection.supported:
             raise NotSupported(
                 feature="projection",
                 details="Repository does not support field projection (select)",
             )
 
-        for i, field in enumerate(query.select):
+        for i, field in enumerate(select):
             if not isinstance(field, str):
                 raise ValidationError(
                     f"Select field must be a string, got {type(field).__name__}",
@@ -298,26 +389,27 @@ def validate_queryspec(
     # ---------------------------------------------------------------------------
     # Validate filtering (where)
     # ---------------------------------------------------------------------------
-    if query.where is not None:
-        if not caps.filter.supported:
+    if where is not None:
+        filter_caps = caps.filter
+        if not filter_caps.supported:
             raise NotSupported(
                 feature="filtering",
                 details="Repository does not support filtering (where clause)",
             )
 
-        _validate_where_node(query.where, caps, allowed_fields, "where")
+        _validate_where_node(where, filter_caps, allowed_fields, "where")
 
     # ---------------------------------------------------------------------------
     # Validate ordering (order_by)
     # ---------------------------------------------------------------------------
-    if query.order_by is not None:
+    if order_by is not None:
         if not caps.order_by.supported:
             raise NotSupported(
                 feature="ordering",
                 details="Repository does not support ordering (order_by)",
             )
 
-        for i, order_field in enumerate(query.order_by):
+        for i, order_field in enumerate(order_by):
             if not isinstance(order_field, str):
                 raise ValidationError(
                     f"Order field must be a string, got {type(order_field).__name__}",
@@ -338,58 +430,59 @@ def validate_queryspec(
     # ---------------------------------------------------------------------------
     # Validate pagination
     # ---------------------------------------------------------------------------
-    if (query.limit is not None or query.offset != 0) and not caps.pagination.supported:
+    if (limit is not None or offset != 0) and not caps.pagination.supported:
         raise NotSupported(
             feature="pagination",
             details="Repository does not support pagination",
         )
 
     # Validate limit
-    if query.limit is not None:
-        if not isinstance(query.limit, int):
+    if limit is not None:
+        if not isinstance(limit, int):
             raise ValidationError(
-                f"Limit must be an integer, got {type(query.limit).__name__}",
+                f"Limit must be an integer, got {type(limit).__name__}",
                 field="limit",
-                value=query.limit,
+                value=limit,
             )
 
-        if query.limit < 0:
+        if limit < 0:
             raise ValidationError(
                 "Limit must be non-negative",
                 field="limit",
-                value=query.limit,
+                value=limit,
             )
 
-        # Apply max_limit from capabilities
-        if caps.pagination.max_limit is not None:
-            result_limit = min(query.limit, caps.pagination.max_limit)
+        # Apply max_limit from capabilities (only an actual clamp changes the limit)
+        max_limit = caps.pagination.max_limit
+        if max_limit is not None and limit > max_limit:
+            result_limit = max_limit
 
     # Validate offset
-    if not isinstance(query.offset, int):
+    if not isinstance(offset, int):
         raise ValidationError(
-            f"Offset must be an integer, got {type(query.offset).__name__}",
+            f"Offset must be an integer, got {type(offset).__name__}",
             field="offset",
-            value=query.offset,
+            value=offset,
         )
 
-    if query.offset < 0:
+    if offset < 0:
         raise ValidationError(
             "Offset must be non-negative",
             field="offset",
-            value=query.offset,
+            value=offset,
         )
 
     # ---------------------------------------------------------------------------
     # Return validated (possibly modified) QuerySpec
     # ---------------------------------------------------------------------------
-    if result_limit != query.limit:
+    if result_limit is not limit:
         # Return new QuerySpec with clamped limit
         return QuerySpec(
-            select=query.select,
-            where=query.where,
-            order_by=query.order_by,
+            select=select,
+            where=where,
+            order_by=order_by,
             limit=result_limit,
-            offset=query.offset,
+            offset=offset,
         )
 
     return query
@@ -398,6 +491,8 @@ def validate_queryspec(
 __all__ = [
     "validate_queryspec",
     "get_expected_arity",
+    "MAX_WHERE_DEPTH",
+    "MAX_WHERE_NODES",
     "ALL_KNOWN_OPS",
     "ARITY_2_UNARY",
     "ARITY_3_COMPARISON",
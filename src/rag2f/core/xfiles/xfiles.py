@@ -9,8 +9,10 @@ collection of data repositories within RAG2F - "The truth is out there."
 """
 
 import logging
-from collections.abc import Callable, Iterator
+import sys
+from collections.abc import Callable, Iterable, Iterator, KeysView, Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -23,6 +25,7 @@ from rag2f.core.dto.xfiles_dto import GetResult, RegisterResult, SearchRepoResul
 from rag2f.core.xfiles.capabilities import Capabilities
 from rag2f.core.xfiles.repository import (
     BaseRepository,
+    implements_protocol,
 )
 
 if TYPE_CHECKING:
@@ -33,6 +36,9 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseRepository)
 
+# Missing-key sentinel for single-probe metadata lookups (None is a valid value)
+_MISS = object()
+
 
 # =============================================================================
 # REPOSITORY ENTRY (INTERNAL)
@@ -54,6 +60,69 @@ class RepositoryEntry:
     id: str
     repository: BaseRepository
     meta: dict[str, Any] = field(default_factory=dict)
+    _caps: Capabilities | None = field(default=None, init=False, repr=False, compare=False)
+    _meta_view: Mapping[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Create the read-only view of meta handed out by XFiles."""
+        self._meta_view = MappingProxyType(self.meta)
+
+    def capabilities(self) -> Capabilities:
+        """Return the repository capabilities, fetched once and then cached.
+
+        Only used by XFiles(cache_capabilities=True); use
+        XFiles.invalidate_capabilities() to refetch them.
+        """
+        caps = self._caps
+        if caps is None:
+            caps = self._caps = self.repository.capabilities()
+        return caps
+
+
+def _meta_matcher(criteria: dict[str, Any]) -> Callable[[Mapping[str, Any]], bool]:
+    """Build the metadata predicate for execute_search_by_meta criteria.
+
+    Criteria are classified once (exists / any-of / equals), so the returned
+    predicate does no per-entry type checks and one lookup per criterion.
+    """
+    exists: list[str] = []
+    any_of: list[tuple[str, Any]] = []
+    equals: list[tuple[str, Any]] = []
+    for key, value in criteria.items():
+        if value is None:
+            # Just check existence
+            exists.append(key)
+        elif isinstance(value, (list, tuple)):
+            # Check if any value matches; hashed membership when possible
+            try:
+                any_of.append((key, frozenset(value)))
+            except TypeError:
+                any_of.append((key, value))
+        else:
+            equals.append((key, value))
+
+    def matcher(meta: Mapping[str, Any]) -> bool:
+        get = meta.get
+        for key in exists:
+            if key not in meta:
+                return False
+        for key, value in equals:
+            meta_value = get(key, _MISS)
+            if meta_value is _MISS or meta_value != value:
+                return False
+        for key, values in any_of:
+            meta_value = get(key, _MISS)
+            if meta_value is _MISS:
+                return False
+            try:
+                if meta_value not in values:
+                    return False
+            except TypeError:
+                # unhashable meta value probed in a frozenset: cannot be equal
+                return False
+        return True
+
+    return matcher
 
 
 # =============================================================================
@@ -92,14 +161,32 @@ class XFiles:
         >>> caps = xfiles.get_capabilities("users_db")
     """
 
-    def __init__(self, *, spock: Optional["Spock"] = None):
+    def __init__(self, *, spock: Optional["Spock"] = None, cache_capabilities: bool = False):
         """Initialize XFiles repository manager.
 
         Args:
             spock: Optional Spock configuration manager for settings.
+            cache_capabilities: Fetch each repository's capabilities() once per
+                registration instead of on every call. Only enable it when
+                capabilities do not change after registration (or call
+                invalidate_capabilities() when they do).
         """
         self._registry: dict[str, RepositoryEntry] = {}
+        # {id: repository} kept in step with _registry for registry/registry_view
+        self._repositories: dict[str, BaseRepository] = {}
+        self._repositories_view = MappingProxyType(self._repositories)
         self._spock = spock
+        self._cache_capabilities = cache_capabilities
+        # bumped on every registry mutation; guards the cached default repositories
+        self._generation = 0
+        # purpose -> (generation, configured default id, repository) of get_default()
+        self._default_cache: dict[str | None, tuple[int, str | None, BaseRepository]] = {}
+        # Inverted metadata index used by execute_search_by_meta. Id "sets" are
+        # dicts with None values so they keep registration order.
+        self._meta_index: dict[str, dict[Any, dict[str, None]]] = {}
+        self._meta_keys: dict[str, dict[str, None]] = {}
+        # Ids whose value for a key is unhashable (not in _meta_index)
+        self._meta_unindexed: dict[str, set[str]] = {}
         logger.debug("XFiles instance created.")
 
     # =========================================================================
@@ -138,6 +225,46 @@ class XFiles:
             >>> if result.is_ok() and result.created:
             ...     print("Registered!")
         """
+        result = self._register_one(id, repository, meta)
+        if result.created:
+            logger.debug("Repository '%s' registered successfully.", result.id)
+        return result
+
+    def execute_register_many(
+        self,
+        items: Iterable[tuple[str, BaseRepository, dict[str, Any] | None]],
+    ) -> list[RegisterResult]:
+        """Register several repositories in one call.
+
+        Each item is checked exactly as by execute_register(), including
+        against items registered earlier in the same batch.
+
+        Args:
+            items: (id, repository, meta) tuples; meta may be None.
+
+        Returns:
+            One RegisterResult per item, in input order (see execute_register()).
+
+        Example:
+            >>> results = xfiles.execute_register_many([
+            ...     ("users_db", mongo_repo, {"type": "mongodb"}),
+            ...     ("cache", redis_repo, None),
+            ... ])
+            >>> created = [r.id for r in results if r.created]
+        """
+        results = [self._register_one(id, repository, meta) for id, repository, meta in items]
+        created = sum(1 for result in results if result.created)
+        if created:
+            logger.debug("%d repositories registered successfully.", created)
+        return results
+
+    def _register_one(
+        self,
+        id: str,
+        repository: BaseRepository,
+        meta: dict[str, Any] | None,
+    ) -> RegisterResult:
+        """Validate and store one registration."""
         # Validate ID
         if not isinstance(id, str) or not id.strip():
             return RegisterResult.fail(
@@ -151,7 +278,7 @@ class XFiles:
             )
 
         # Protocol compliance
-        if not isinstance(repository, BaseRepository):
+        if not implements_protocol(repository, BaseRepository):
             return RegisterResult.fail(
                 StatusDetail(
                     code=StatusCode.INVALID,
@@ -187,13 +314,20 @@ class XFiles:
                 created=False,
             )
 
+        # Store the canonical interned id: lookups with literal (or interned)
+        # ids then match the registry key by identity, skipping the string compare
+        if type(id) is str:
+            id = sys.intern(id)
         entry = RepositoryEntry(
             id=id,
             repository=repository,
-            meta=meta or {},
+            meta=dict(meta) if meta else {},
         )
         self._registry[id] = entry
-        logger.debug("Repository '%s' registered successfully.", id)
+        self._repositories[id] = repository
+        self._index_meta(entry)
+        # Bump per insert so a batch that fails midway leaves no stale caches
+        self._generation += 1
         return RegisterResult.success(id=id, created=True)
 
     def unregister(self, id: str) -> bool:
@@ -205,11 +339,49 @@ class XFiles:
         Returns:
             True if the repository was removed, False if not found.
         """
-        if id in self._registry:
-            del self._registry[id]
-            logger.debug("Repository '%s' unregistered.", id)
-            return True
-        return False
+        entry = self._registry.pop(id, None)
+        if entry is None:
+            return False
+        del self._repositories[id]
+        self._unindex_meta(entry)
+        self._generation += 1
+        logger.debug("Repository '%s' unregistered.", id)
+        return True
+
+    def _index_meta(self, entry: RepositoryEntry) -> None:
+        """Add an entry's metadata to the inverted metadata index."""
+        entry_id = entry.id
+        meta_index = self._meta_index
+        for key, value in entry.meta.items():
+            self._meta_keys.setdefault(key, {})[entry_id] = None
+            try:
+                meta_index.setdefault(key, {}).setdefault(value, {})[entry_id] = None
+            except TypeError:
+                self._meta_unindexed.setdefault(key, set()).add(entry_id)
+
+    def _unindex_meta(self, entry: RepositoryEntry) -> None:
+        """Remove an entry's metadata from the inverted metadata index."""
+        entry_id = entry.id
+        for key, value in entry.meta.items():
+            with_key = self._meta_keys[key]
+            del with_key[entry_id]
+            if not with_key:
+                del self._meta_keys[key]
+
+            unindexed = self._meta_unindexed.get(key)
+            if unindexed is not None and entry_id in unindexed:
+                unindexed.discard(entry_id)
+                if not unindexed:
+                    del self._meta_unindexed[key]
+                continue
+
+            by_value = self._meta_index[key]
+            ids = by_value[value]
+            del ids[entry_id]
+            if not ids:
+                del by_value[value]
+                if not by_value:
+                    del self._meta_index[key]
 
     # =========================================================================
     # LOOKUP
@@ -240,7 +412,9 @@ class XFiles:
                     context={"id": id},
                 ),
             )
-        return GetResult.success(repository=entry.repository, id=id)
+        # Same as GetResult.success(): the field defaults are status="success" and
+        # detail=None, and leaving them out skips validating them on every hit
+        return GetResult(repository=entry.repository, id=id)
 
     def get_typed(self, id: str, protocol: type[T]) -> T | None:
         """Get a repository by ID with type checking.
@@ -260,7 +434,7 @@ class XFiles:
         entry = self._registry.get(id)
         if entry is None:
             return None
-        if isinstance(entry.repository, protocol):
+        if implements_protocol(entry.repository, protocol):
             return entry.repository  # type: ignore
         logger.debug(
             "Repository '%s' found but not compatible with %s.",
@@ -269,9 +443,24 @@ class XFiles:
         )
         return None
 
-    def get_meta(self, id: str) -> dict[str, Any] | None:
+    def get_meta(self, id: str) -> Mapping[str, Any] | None:
         """Get the metadata for a repository.
 
+        Args:
+            id: The repository identifier.
+
+        Returns:
+            Read-only view of the metadata if found, None otherwise. Use
+            copy_meta() for a mutable copy.
+        """
+        entry = self._registry.get(id)
+        if entry is None:
+            return None
+        return entry._meta_view
+
+    def copy_meta(self, id: str) -> dict[str, Any] | None:
+        """Get a mutable copy of the metadata for a repository.
+
         Args:
             id: The repository identifier.
 
@@ -290,11 +479,38 @@ class XFiles:
             id: The repository identifier.
 
         Returns:
-            Capabilities if found, None otherwise.
+            Capabilities if found, None otherwise. Read from the repository on
+            each call, unless XFiles was created with cache_capabilities=True
+            (then cached per registration, see invalidate_capabilities()).
         """
         entry = self._registry.get(id)
         if entry is None:
             return None
+        return self._capabilities(entry)
+
+    def invalidate_capabilities(self, id: str) -> bool:
+        """Drop the cached capabilities of a repository.
+
+        With cache_capabilities=True, capabilities are fetched once per
+        registration; call this when a repository's capabilities() result
+        changes (e.g., after connecting). Without caching it is a no-op.
+
+        Args:
+            id: The repository identifier.
+
+        Returns:
+            True if the repository exists, False otherwise.
+        """
+        entry = self._registry.get(id)
+        if entry is None:
+            return False
+        entry._caps = None
+        return True
+
+    def _capabilities(self, entry: RepositoryEntry) -> Capabilities:
+        """Return an entry's capabilities, cached only when caching is enabled."""
+        if self._cache_capabilities:
+            return entry.capabilities()
         return entry.repository.capabilities()
 
     def has(self, id: str) -> bool:
@@ -314,15 +530,15 @@ class XFiles:
 
     def execute_search(
         self,
-        predicate: Callable[[dict[str, Any]], bool],
+        predicate: Callable[[Mapping[str, Any]], bool],
     ) -> SearchRepoResult:
         """Search repositories by metadata predicate.
 
         [Result Pattern] Check result.is_ok() and result.repositories.
 
         Args:
-            predicate: Function that takes metadata dict and returns
-                True if the repository should be included.
+            predicate: Function that takes a read-only view of the metadata
+                and returns True if the repository should be included.
 
         Returns:
             SearchRepoResult with:
@@ -339,7 +555,7 @@ class XFiles:
         ids = []
         for entry in self._registry.values():
             try:
-                if predicate(entry.meta):
+                if predicate(entry._meta_view):
                     repositories.append(entry.repository)
                     ids.append(entry.id)
             except Exception as e:
@@ -374,8 +590,14 @@ class XFiles:
                 - Lists: at least one element must match.
                 - None: key must exist in meta.
 
+        Hashable criteria are answered from the metadata index: the ids under
+        the rarest criterion are walked and checked against the others' id
+        sets. A criterion whose value is unhashable, or whose key has an
+        unhashable metadata value in any repository, falls back to a linear
+        scan of every registered repository.
+
         Returns:
-            SearchRepoResult with matching repositories.
+            SearchRepoResult with matching repositories, in registration order.
 
         Example:
             >>> result = xfiles.execute_search_by_meta(type="mongodb", domain="users")
@@ -383,24 +605,108 @@ class XFiles:
             ...     for repo in result.repositories:
             ...         use(repo)
         """
+        ids = self._search_meta_index(criteria)
+        if ids is None:
+            # Criteria or metadata the index cannot answer: scan every entry
+            return self.execute_search(_meta_matcher(criteria))
+        return self._ids_result(ids, "No repositories matched the predicate")
 
-        def matcher(meta: dict[str, Any]) -> bool:
-            for key, value in criteria.items():
-                if key not in meta:
-                    return False
-                meta_value = meta[key]
-                if value is None:
-                    # Just check existence
-                    continue
-                if isinstance(value, (list, tuple)):
-                    # Check if any value matches
-                    if meta_value not in value:
-                        return False
-                elif meta_value != value:
-                    return False
-            return True
+    def execute_search_by_range(
+        self,
+        key: str,
+        low: Any = None,
+        high: Any = None,
+    ) -> SearchRepoResult:
+        """Search repositories whose metadata value for a key lies in a range.
+
+        [Result Pattern] Check result.is_ok() and result.repositories.
+
+        Each distinct value of the key is compared once (via the metadata
+        index), not once per repository. Values that cannot be compared with
+        the bounds (e.g., a string against numeric bounds) never match.
+
+        Args:
+            key: Metadata key to filter on (e.g., "priority").
+            low: Inclusive lower bound, or None for no lower bound.
+            high: Inclusive upper bound, or None for no upper bound.
+
+        Returns:
+            SearchRepoResult with matching repositories, in registration order.
+
+        Example:
+            >>> result = xfiles.execute_search_by_range("priority", low=1, high=5)
+            >>> if result.is_ok():
+            ...     for repo in result.repositories:
+            ...         use(repo)
+        """
+        matched: set[str] = set()
+        for value, ids in self._meta_index.get(key, {}).items():
+            try:
+                if (low is None or value >= low) and (high is None or value <= high):
+                    matched.update(ids)
+            except TypeError:
+                continue
+
+        ids = [entry_id for entry_id in self._meta_keys.get(key, ()) if entry_id in matched]
+        return self._ids_result(ids, "No repositories matched the range")
+
+    def _ids_result(self, ids: list[str], no_results_message: str) -> SearchRepoResult:
+        """Build the SearchRepoResult for a list of matching ids."""
+        if not ids:
+            return SearchRepoResult.success(
+                repositories=[],
+                ids=[],
+                detail=StatusDetail(
+                    code=StatusCode.NO_RESULTS,
+                    message=no_results_message,
+                ),
+            )
+        repositories = self._repositories
+        return SearchRepoResult.success(
+            repositories=[repositories[entry_id] for entry_id in ids], ids=ids
+        )
 
-        return self.execute_search(matcher)
+    def _search_meta_index(self, criteria: dict[str, Any]) -> list[str] | None:
+        """Answer execute_search_by_meta criteria from the inverted index.
+
+        Returns:
+            Matching ids in registration order, or None when a criterion value
+            is unhashable or a criterion key has unhashable metadata values.
+        """
+        if not criteria:
+            return list(self._registry)
+
+        meta_unindexed = self._meta_unindexed
+        if any(key in meta_unindexed for key in criteria):
+            return None
+
+        meta_index = self._meta_index
+        meta_keys = self._meta_keys
+        ordered: list[dict[str, None]] = []
+        members: list[dict[str, None] | set[str]] = []
+        for key, value in criteria.items():
+            with_key = meta_keys.get(key)
+            if with_key is None:
+                return []
+            by_value = meta_index.get(key, {})
+            try:
+                if value is None:
+                    ordered.append(with_key)
+                elif isinstance(value, (list, tuple)):
+                    ordered.append(with_key)
+                    members.append(set().union(*[by_value.get(v, ()) for v in value]))
+                else:
+                    ids = by_value.get(value)
+                    if ids is None:
+                        return []
+                    ordered.append(ids)
+            except TypeError:
+                return None
+
+        # Walk the smallest ordered id set, keeping ids present in all the others
+        seed = min(ordered, key=len)
+        members += [ids for ids in ordered if ids is not seed]
+        return [entry_id for entry_id in seed if all(entry_id in ids for ids in members)]
 
     def execute_search_by_capability(
         self,
@@ -410,6 +716,9 @@ class XFiles:
 
         [Result Pattern] Check result.is_ok() and result.repositories.
 
+        Capabilities are read from each repository on every call, unless XFiles
+        was created with cache_capabilities=True.
+
         Args:
             capability_check: Function that takes Capabilities and returns
                 True if the repository should be included.
@@ -429,8 +738,7 @@ class XFiles:
         ids = []
         for entry in self._registry.values():
             try:
-                caps = entry.repository.capabilities()
-                if capability_check(caps):
+                if capability_check(self._capabilities(entry)):
                     repositories.append(entry.repository)
                     ids.append(entry.id)
             except Exception as e:
@@ -461,7 +769,17 @@ class XFiles:
         Returns:
             List of repository IDs in the registry.
         """
-        return list(self._registry.keys())
+        return list(self._registry)
+
+    def iter_ids(self) -> KeysView[str]:
+        """Get a live, read-only view of the registered repository IDs.
+
+        Unlike list_ids, no list is allocated; the view reflects later changes.
+
+        Returns:
+            Keys view over the registry.
+        """
+        return self._repositories.keys()
 
     def __len__(self) -> int:
         """Return the number of registered repositories."""
@@ -469,8 +787,7 @@ class XFiles:
 
     def __iter__(self) -> Iterator[tuple[str, BaseRepository]]:
         """Iterate over (id, repository) pairs."""
-        for entry in self._registry.values():
-            yield entry.id, entry.repository
+        return iter(self._repositories.items())
 
     def __contains__(self, id: str) -> bool:
         """Check if repository ID exists in registry."""
@@ -483,7 +800,16 @@ class XFiles:
         Returns:
             Shallow copy of the registry dictionary.
         """
-        return {entry.id: entry.repository for entry in self._registry.values()}
+        return self._repositories.copy()
+
+    @property
+    def registry_view(self) -> MappingProxyType[str, BaseRepository]:
+        """Get a live, read-only {id: repository} view of the registry.
+
+        Returns:
+            A mapping proxy over the registry (no copy is made).
+        """
+        return self._repositories_view
 
     # =========================================================================
     # DEFAULT RESOLUTION
@@ -503,14 +829,24 @@ class XFiles:
             LookupError: If no repositories are registered or default
                 selection fails.
         """
+        config_key = f"repository_default_{purpose}" if purpose else "repository_default"
+        configured_id = self._resolve_config_key(config_key)
+
+        # Fast path: registry and configured id unchanged since the last call.
+        cache = self._default_cache.get(purpose)
+        if cache is not None and cache[0] == self._generation and cache[1] == configured_id:
+            return cache[2]
+
+        repository = self._select_default(config_key, configured_id)
+        self._default_cache[purpose] = (self._generation, configured_id, repository)
+        return repository
+
+    def _select_default(self, config_key: str, configured_id: str | None) -> BaseRepository:
         registry_size = len(self._registry)
 
         if registry_size == 0:
             raise LookupError("No repositories registered; unable to determine default.")
 
-        config_key = f"repository_default_{purpose}" if purpose else "repository_default"
-        configured_id = self._resolve_config_key(config_key)
-
         if registry_size == 1:
             only_id, entry = next(iter(self._registry.items()))
             if configured_id and configured_id != only_id:
@@ -73,6 +73,21 @@ class TestOptimusPrime:
         with pytest.raises(TypeError, match="does not implement the Embedder protocol"):
             optimus.register("invalid", "not_an_embedder")
 
+    def test_register_checks_each_instance_of_non_conforming_class(self):
+        """Protocol checks are only cached for classes that conform on their own."""
+
+        class InstanceSized:
+            def getEmbedding(self, text: str, *, normalize: bool = False) -> list[float]:
+                return []
+
+        optimus = OptimusPrime()
+        sized = InstanceSized()
+        sized.size = 3
+        optimus.register("sized", sized)
+
+        with pytest.raises(TypeError, match="does not implement the Embedder protocol"):
+            optimus.register("unsized", InstanceSized())
+
     def test_register_duplicate_key(self):
         """Test registering duplicate key raises ValueError."""
         optimus = OptimusPrime()
@@ -183,6 +198,24 @@ class TestOptimusPrime:
         registry["e3"] = MockEmbedder()
         assert not optimus.has("e3")
 
+    def test_registry_view_and_iter_keys_are_live_and_read_only(self):
+        """Views reflect registry changes without allowing mutation."""
+        optimus = OptimusPrime()
+        view = optimus.registry_view
+        keys = optimus.iter_keys()
+
+        embedder = MockEmbedder()
+        optimus.register("e1", embedder)
+
+        assert view["e1"] is embedder
+        assert list(keys) == ["e1"]
+        with pytest.raises(TypeError):
+            view["e2"] = MockEmbedder()
+
+        optimus.unregister("e1")
+        assert len(view) == 0
+        assert "e1" not in keys
+
     def test_get_default_single_embedder_without_hint(self):
         """Default lookup returns sole embedder when no config is provided."""
         optimus = OptimusPrime(spock=StubSpock())
@@ -236,3 +269,21 @@ class TestOptimusPrime:
 
         with pytest.raises(LookupError, match="No embedders registered"):
             optimus.get_default()
+
+    def test_get_default_follows_registry_and_config_changes(self):
+        """Cached default is refreshed when the registry or the configured key change."""
+        spock = StubSpock("first")
+        optimus = OptimusPrime(spock=spock)
+        first = MockEmbedder()
+        second = MockEmbedder()
+        optimus.register("first", first)
+
+        assert optimus.get_default() is first
+        assert optimus.get_default() is first
+
+        optimus.register("second", second)
+        spock.embedder_default = "second"
+        assert optimus.get_default() is second
+
+        optimus.unregister("second")
+        assert optimus.get_default() is first
@@ -1,11 +1,13 @@
 """Tests for Spock configuration system."""
 
 import json
+import math
 import os
 import tempfile
 
 import pytest
 
+from rag2f.core.spock import spock as spock_module
 from rag2f.core.spock.spock import ConfigManager, Spock
 
 
@@ -75,6 +77,22 @@ class TestSpockJSONConfiguration:
         finally:
             os.unlink(config_path)
 
+    def test_reload_reparses_changed_file_and_isolates_instances(self, tmp_path):
+        """Cached JSON is invalidated on change and never shared between instances."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"rag2f": {"key": "first"}}), encoding="utf-8")
+
+        spock1 = Spock(config_path=str(config_path))
+        spock1.load()
+        spock1.set_rag2f_config("key", "mutated")
+        spock2 = Spock(config_path=str(config_path))
+        spock2.load()
+        assert spock2.get_rag2f_config("key") == "first"
+
+        config_path.write_text(json.dumps({"rag2f": {"key": "second-value"}}), encoding="utf-8")
+        spock2.reload()
+        assert spock2.get_rag2f_config("key") == "second-value"
+
 
 class TestSpockEnvironmentVariables:
     """Test environment variable configuration."""
@@ -156,6 +174,58 @@ class TestSpockEnvironmentVariables:
             del os.environ["RAG2F__PLUGINS__TEST__TAGS"]
             del os.environ["RAG2F__PLUGINS__TEST__META"]
 
+    def test_nested_env_keys_are_lowercased(self, monkeypatch):
+        """Nested env paths create intermediate dicts with lowercase keys."""
+        monkeypatch.setenv("RAG2F__PLUGINS__My_Plugin__DB__HOST", "localhost")
+        monkeypatch.setenv("RAG2F__PLUGINS__MY_PLUGIN__DB__PORT", "5432")
+        monkeypatch.setenv("RAG2F__RAG2F__LIMITS__MAX_TOKENS", "100")
+
+        spock = Spock()
+        spock.load()
+
+        assert spock.get_plugin_config("my_plugin", "db") == {"host": "localhost", "port": 5432}
+        assert spock.get_rag2f_config("limits") == {"max_tokens": 100}
+
+    def test_plugin_lookup_falls_back_to_lowercase_id(self, monkeypatch):
+        """Mixed-case plugin ids find env overrides stored under lowercase ids."""
+        monkeypatch.setenv("RAG2F__PLUGINS__AZURE_EMBEDDER__API_KEY", "env-key")
+
+        spock = Spock()
+        spock.load({"plugins": {"Mixed_Case": {"api_key": "json-key"}}})
+
+        assert spock.get_plugin_config("Azure_Embedder", "api_key") == "env-key"
+        assert spock.get_plugin_config("Azure_Embedder") == {"api_key": "env-key"}
+        assert spock.get_plugin_config("Mixed_Case", "api_key") == "json-key"
+
+    def test_env_entries_replayed_on_reload_are_not_shared(self, monkeypatch):
+        """Replayed env values are fresh copies, unaffected by earlier mutation."""
+        monkeypatch.setenv("RAG2F__PLUGINS__P__META", '{"a": 1}')
+
+        spock = Spock()
+        spock.load()
+        spock.get_plugin_config("p", "meta")["a"] = 2
+        spock.reload(force=True)
+
+        assert spock.get_plugin_config("p", "meta") == {"a": 1}
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("azure_openai", "azure_openai"),
+            ("https://example.com", "https://example.com"),
+            ("", ""),
+            ("-5", -5),
+            (" 7", 7),
+            ("false", False),
+            ("null", None),
+            ("name", "name"),
+            ("{broken", "{broken"),
+        ],
+    )
+    def test_parse_env_value(self, raw, expected):
+        """Env values parse as JSON when possible and fall back to the raw string."""
+        assert Spock()._parse_env_value(raw) == expected
+
 
 class TestSpockGetters:
     """Test configuration getter methods."""
@@ -264,6 +334,33 @@ class TestSpockReload:
         finally:
             del os.environ["RAG2F__RAG2F__NEW_KEY"]
 
+    def test_reload_skips_unchanged_sources_but_discards_runtime_sets(self):
+        """Reload is a no-op for unchanged sources unless a setter was used."""
+        spock = Spock()
+        spock.load()
+        view = spock.get_rag2f_config()
+
+        spock.reload()
+        assert spock.get_rag2f_config() is view
+
+        spock.set_rag2f_config("runtime_key", "value")
+        spock.reload()
+        assert spock.get_rag2f_config("runtime_key") is None
+
+    def test_forced_reload_restores_values_mutated_in_place(self, tmp_path):
+        """In-place changes are not tracked; reload(force=True) restores the sources."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"rag2f": {"nested": {"a": 1}}}')
+        spock = Spock(config_path=str(config_file))
+        spock.load()
+
+        spock.get_rag2f_config("nested")["a"] = 2
+        spock.reload()
+        assert spock.get_rag2f_config("nested") == {"a": 2}
+
+        spock.reload(force=True)
+        assert spock.get_rag2f_config("nested") == {"a": 1}
+
 
 class TestSpockGetAllConfig:
     """Test getting complete configuration."""
@@ -287,3 +384,132 @@ class TestSpockGetAllConfig:
             assert all_config["plugins"]["plugin1"]["setting1"] == "value1"
         finally:
             os.unlink(config_path)
+
+
+class TestSpockSnapshots:
+    """Test read-only views and opt-in copies returned by getters."""
+
+    def test_views_are_read_only_and_track_updates(self):
+        """Whole-section getters return read-only views refreshed by setters."""
+        spock = Spock()
+        spock.load({"rag2f": {"a": 1, "nested": {"b": [1]}}, "plugins": {"p": {"x": 1}}})
+
+        rag2f_view = spock.get_rag2f_config()
+        with pytest.raises(TypeError):
+            rag2f_view["a"] = 2
+        assert rag2f_view["nested"]["b"] == [1]
+        assert spock.get_plugin_config("missing") == {}
+        with pytest.raises(TypeError):
+            spock.get_all_config()["rag2f"] = {}
+        assert spock.get_rag2f_config() is rag2f_view
+
+        spock.set_plugin_config("p", "y", 2)
+        assert spock.get_plugin_config("p") == {"x": 1, "y": 2}
+
+    def test_views_and_keyed_getters_agree(self):
+        """Views are live: values changed through a keyed getter are seen everywhere."""
+        spock = Spock()
+        spock.load({"rag2f": {}, "plugins": {"p": {"opts": {"x": 1}, "hosts": ["a", "b"]}}})
+        plugin_view = spock.get_plugin_config("p")
+        all_view = spock.get_all_config()
+
+        spock.get_plugin_config("p", "opts")["x"] = 2
+
+        assert plugin_view["opts"] == {"x": 2}
+        assert spock.get_all_config()["plugins"]["p"]["opts"] == {"x": 2}
+        assert all_view["plugins"]["p"]["opts"] == {"x": 2}
+        assert spock.get_plugin_config("p")["hosts"] == ["a", "b"]
+        assert spock.get_plugin_config("p", "hosts") == ["a", "b"]
+        copied = json.loads(json.dumps(spock.get_all_config(copy=True)))
+        assert copied["plugins"]["p"]["hosts"] == ["a", "b"]
+
+    def test_copy_returns_independent_mutable_config(self):
+        """copy=True returns a deep copy that does not alias internal state."""
+        spock = Spock()
+        spock.load({"rag2f": {"nested": {"a": 1}}, "plugins": {"p": {"x": [1]}}})
+
+        rag2f_copy = spock.get_rag2f_config(copy=True)
+        rag2f_copy["nested"]["a"] = 2
+        spock.get_plugin_config("p", copy=True)["x"].append(2)
+        spock.get_all_config(copy=True)["plugins"].clear()
+
+        assert spock.get_rag2f_config("nested") == {"a": 1}
+        assert spock.get_plugin_config("p", "x") == [1]
+        assert "p" in spock.get_all_config()["plugins"]
+
+    def test_load_config_object_copy_flag(self):
+        """load() copies the provided config unless copy=False hands it over."""
+        config = {"rag2f": {"a": 1}, "plugins": {}}
+
+        copied = Spock()
+        copied.load(config)
+        config["rag2f"]["a"] = 2
+        assert copied.get_rag2f_config("a") == 1
+
+        adopted = Spock()
+        adopted.load(config, copy=False)
+        config["rag2f"]["a"] = 3
+        assert adopted.get_rag2f_config("a") == 3
+
+    def test_copy_handles_non_json_runtime_values(self):
+        """Runtime values outside the JSON types are still deep-copied."""
+        spock = Spock()
+        spock.load()
+        spock.set_rag2f_config("tags", {"a"})
+        spock.set_rag2f_config("pair", (1, [2]))
+
+        copied = spock.get_rag2f_config(copy=True)
+        copied["tags"].add("b")
+        copied["pair"][1].append(3)
+
+        assert spock.get_rag2f_config("tags") == {"a"}
+        assert spock.get_rag2f_config("pair") == (1, [2])
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def json_decoder(request, monkeypatch):
+    """Run a test once per JSON decoder Spock may use."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(spock_module, "_json_loads", json.loads)
+    else:
+        pytest.importorskip("orjson")
+    spock_module.Spock._read_json_cached.cache_clear()
+    return request.param
+
+
+class TestSpockDecoders:
+    """Parsing results must not depend on whether orjson is installed."""
+
+    def test_env_values_decode_identically(self, json_decoder, monkeypatch):
+        """Wide integers and -Infinity parse the same under both decoders."""
+        monkeypatch.setenv("RAG2F__RAG2F__BIG", str(2**70))
+        monkeypatch.setenv("RAG2F__RAG2F__LOW", "-Infinity")
+        monkeypatch.setenv("RAG2F__RAG2F__LIST", "[1, 2.5]")
+
+        spock = Spock()
+        spock.load()
+
+        assert spock.get_rag2f_config("big") == 2**70
+        assert spock.get_rag2f_config("low") == float("-inf")
+        assert spock.get_rag2f_config("list") == [1, 2.5]
+
+    def test_non_finite_env_values_are_floats(self, json_decoder):
+        """NaN, Infinity and -Infinity env values all parse to floats."""
+        parse = Spock()._parse_env_value
+
+        assert math.isnan(parse("NaN"))
+        assert parse("Infinity") == float("inf")
+        assert parse("-Infinity") == float("-inf")
+        assert parse("Nothing") == "Nothing"
+        assert parse("Ireland") == "Ireland"
+
+    def test_config_file_decodes_identically(self, json_decoder, tmp_path):
+        """JSON files with wide integers and -Infinity load under both decoders."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(f'{{"rag2f": {{"big": {2**70}, "low": -Infinity}}}}')
+
+        spock = Spock(config_path=str(config_file))
+        spock.load()
+
+        assert spock.get_rag2f_config("big") == 2**70
+        assert spock.get_rag2f_config("low") == float("-inf")
@@ -1,9 +1,17 @@
 """Tests for Capabilities helper methods."""
 
+import json
+import sys
+from dataclasses import replace
+
+import pytest
+
 from rag2f.core.xfiles import (
     Capabilities,
     FilterCapability,
     NativeCapability,
+    minimal_crud_capabilities,
+    standard_queryable_capabilities,
 )
 
 
@@ -67,3 +75,73 @@ class TestCapabilitiesHelperMethods:
         # Even though "primary" is in kinds, native is not supported
         assert caps.supports_native_kind("primary") is False
         assert caps.supports_native_kind("session") is False
+
+    def test_membership_follows_replace_and_keeps_declared_order(self):
+        """Membership checks track replaced ops while ops keeps its declared order."""
+        base = FilterCapability(supported=True, ops=("or", "eq"))
+        caps = Capabilities(filter=replace(base, ops=("in",)))
+
+        assert base.ops == ("or", "eq")
+        assert caps.supports_operator("in") is True
+        assert caps.supports_operator("eq") is False
+        assert replace(base) == base
+
+
+class TestCapabilitiesSerialization:
+    """Test Capabilities to_dict/from_dict conversion."""
+
+    def test_round_trip_preserves_capabilities(self):
+        """from_dict(to_dict()) should rebuild an equal Capabilities."""
+        caps = standard_queryable_capabilities(pushdown=True)
+
+        data = caps.to_dict()
+
+        assert data["filter"]["ops"] == list(caps.filter.ops)
+        assert Capabilities.from_dict(data) == caps
+
+    def test_from_dict_sequence_fields_accept_tuples_and_reject_others(self):
+        """Sequence fields accept lists or tuples and fall back to defaults otherwise."""
+        assert FilterCapability.from_dict({"ops": ("eq", "in")}).ops == ("eq", "in")
+        assert FilterCapability.from_dict({"ops": "eq"}).ops == ()
+        assert NativeCapability.from_dict({"kinds": None}).kinds == ("primary",)
+
+    def test_extra_defaults_to_shared_read_only_mapping(self):
+        """Default extra is shared and omitted; a custom extra is emitted as a copy."""
+        assert Capabilities().extra is Capabilities.from_dict({}).extra
+        assert "extra" not in Capabilities().to_dict()
+
+        extra = {"ttl": True}
+        data = Capabilities(extra=extra).to_dict()
+
+        assert data["extra"] == extra
+        assert data["extra"] is not extra
+
+    def test_from_dict_interns_decoded_filter_ops(self):
+        """Operator names decoded from JSON are interned to the canonical literals."""
+        data = json.loads('{"ops": ["eq", "between"]}')
+
+        ops = FilterCapability.from_dict(data).ops
+
+        assert ops == ("eq", "between")
+        assert ops[0] is sys.intern("eq")
+
+
+class TestFactoryHelpers:
+    """Test the shared default instances returned by the factory helpers."""
+
+    def test_default_calls_share_one_read_only_instance(self):
+        """Default factory calls return one shared instance whose extra is read-only."""
+        assert minimal_crud_capabilities() is minimal_crud_capabilities()
+        caps = standard_queryable_capabilities()
+        assert caps is standard_queryable_capabilities()
+        with pytest.raises(TypeError):
+            caps.extra["leak"] = True  # type: ignore[index]
+
+    def test_non_default_arguments_build_a_new_instance(self):
+        """Non-default arguments are honored and never return the shared instance."""
+        caps = standard_queryable_capabilities(max_limit=50, pushdown=True)
+
+        assert caps is not standard_queryable_capabilities()
+        assert caps.pagination.max_limit == 50
+        assert caps.filter.pushdown is True
+        assert caps.extra == {}
@@ -3,15 +3,22 @@
 import pytest
 
 from rag2f.core.xfiles import (
+    MAX_WHERE_DEPTH,
+    MAX_WHERE_NODES,
     Capabilities,
+    FilterCapability,
+    NotSupported,
+    QueryCapability,
     QuerySpec,
     ValidationError,
     and_,
     contains,
     eq,
+    gt,
     in_,
     not_,
     or_,
+    standard_queryable_capabilities,
     validate_queryspec,
 )
 
@@ -29,6 +36,99 @@ class TestEdgeCases:
         result = validate_queryspec(query, full_caps)
         assert result == query
 
+    def test_where_depth_is_capped(self, full_caps: Capabilities):
+        """Nesting up to MAX_WHERE_DEPTH validates; one more level is rejected."""
+        where = eq("a", 1)
+        for _ in range(MAX_WHERE_DEPTH - 1):
+            where = not_(where)
+
+        validate_queryspec(QuerySpec(where=where), full_caps)
+
+        with pytest.raises(ValidationError, match="too deep") as exc_info:
+            validate_queryspec(QuerySpec(where=not_(where)), full_caps)
+        assert exc_info.value.field == "where"
+
+    def test_hostile_deep_where_is_rejected_by_the_depth_budget(self, full_caps: Capabilities):
+        """A 10**6-level tree is rejected up front, on every call, without deep hashing."""
+        where = eq("a", 1)
+        for _ in range(10**6):
+            where = ("not", where)
+        query = QuerySpec(where=where)
+
+        for _ in range(2):
+            with pytest.raises(ValidationError, match="too deep") as exc_info:
+                validate_queryspec(query, full_caps)
+            assert exc_info.value.field == "where"
+
+    def test_where_node_count_is_capped(self, full_caps: Capabilities):
+        """A shallow tree with more than MAX_WHERE_NODES nodes is rejected."""
+        conditions = [eq("a", i) for i in range(MAX_WHERE_NODES // 2 + 1)]
+
+        validate_queryspec(QuerySpec(where=and_(*conditions[:-1])), full_caps)
+
+        with pytest.raises(ValidationError, match="too large") as exc_info:
+            validate_queryspec(QuerySpec(where=and_(*conditions)), full_caps)
+        assert exc_info.value.field == "where"
+
+    def test_first_error_reported_in_left_to_right_order(self, full_caps: Capabilities):
+        """The leftmost invalid node is reported, with its path in the AST."""
+        query = QuerySpec(where=and_(or_(eq("a", 1), ("eq", 2, 3)), ("eq", "b")))
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_queryspec(query, full_caps)
+
+        assert exc_info.value.field == "where.and.left.or.right[1]"
+
+    def test_repeated_where_is_revalidated_per_caps_and_allowlist(
+        self, full_caps: Capabilities, limited_ops_caps: Capabilities
+    ):
+        """Repeated where validation still honors the capabilities and allowlist given."""
+        query = QuerySpec(where=and_(eq("a", 1), gt("b", 2)))
+
+        for _ in range(2):
+            assert validate_queryspec(query, full_caps, allowed_fields={"a", "b"}) is query
+            with pytest.raises(NotSupported):
+                validate_queryspec(query, limited_ops_caps)
+            with pytest.raises(ValidationError):
+                validate_queryspec(query, full_caps, allowed_fields={"a"})
+
+    def test_filter_ops_declared_as_list(self):
+        """Capabilities declaring ops as a list (unhashable) still validate where clauses."""
+        query = QuerySpec(where=and_(eq("a", 1), eq("b", 2)))
+        for caps in (
+            standard_queryable_capabilities(filter_ops=["eq", "and"]),  # type: ignore[arg-type]
+            Capabilities(
+                query=QueryCapability(supported=True),
+                filter=FilterCapability(supported=True, ops=["eq", "and"]),  # type: ignore[arg-type]
+            ),
+        ):
+            assert validate_queryspec(query, caps) is query
+            with pytest.raises(NotSupported):
+                validate_queryspec(QuerySpec(where=gt("a", 1)), caps)
+
+    def test_nodes_built_from_tuple_and_str_subclasses(self, full_caps: Capabilities):
+        """Subclassed nodes and operators miss the fast path but still validate."""
+
+        class _Node(tuple):
+            pass
+
+        class _Op(str):
+            pass
+
+        where = ("and", _Node((_Op("eq"), "a", 1)), (_Op("gt"), "b", 2))
+        assert validate_queryspec(QuerySpec(where=where), full_caps).where is where
+
+        with pytest.raises(ValidationError, match="requires 3 elements"):
+            validate_queryspec(QuerySpec(where=_Node(("eq", "a"))), full_caps)
+
+    def test_and_or_builders_fold_into_balanced_binary_nodes(self):
+        """and_/or_ keep binary nodes and leaf order but grow only logarithmically deep."""
+        a, b, c, d, e = (eq(name, 1) for name in "abcde")
+
+        assert and_(a, b) == ("and", a, b)
+        assert and_(a, b, c, d, e) == ("and", ("and", ("and", a, b), ("and", c, d)), e)
+        assert or_(a, b, c) == ("or", ("or", a, b), c)
+
     def test_in_operator_with_list_values(self, full_caps: Capabilities):
         """in_ operator with list values should pass (canonical form)."""
         query = QuerySpec(where=in_("status", ["active", "pending", "review"]))
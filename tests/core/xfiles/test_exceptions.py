@@ -0,0 +1,59 @@
+"""Tests for XFiles repository exceptions."""
+
+import pickle
+
+import pytest
+
+from rag2f.core.xfiles import (
+    AlreadyExists,
+    BackendError,
+    NotFound,
+    NotSupported,
+    ValidationError,
+)
+
+
+@pytest.mark.parametrize(
+    "exc,fields",
+    [
+        (NotFound("doc-1", "users"), {"id": "doc-1", "repository": "users"}),
+        (AlreadyExists(42), {"id": 42, "repository": None}),
+        (
+            NotSupported("vector_search", "docs", "no index"),
+            {"feature": "vector_search", "repository": "docs", "details": "no index"},
+        ),
+        (ValidationError("bad limit", "limit", -1), {"details": "bad limit", "field": "limit"}),
+        (BackendError("timeout"), {"details": "timeout", "cause": None}),
+    ],
+)
+def test_exception_fields_survive_pickling(exc, fields):
+    """Slotted fields and the message survive a pickle round-trip."""
+    restored = pickle.loads(pickle.dumps(exc))  # noqa: S301 - data produced in-test
+
+    assert type(restored) is type(exc)
+    assert str(restored) == str(exc)
+    assert restored.args == exc.args
+    for name, value in fields.items():
+        assert getattr(exc, name) == value
+        assert getattr(restored, name) == value
+
+
+def test_message_is_formatted_on_demand():
+    """Messages are built lazily from the fields but still show up in str/args/repr."""
+
+    class _Id:
+        def __init__(self):
+            self.calls = 0
+
+        def __repr__(self):
+            self.calls += 1
+            return "<id>"
+
+    doc_id = _Id()
+    exc = NotFound(doc_id, "users")
+    assert doc_id.calls == 0
+
+    message = "Document with id=<id> not found in repository 'users'."
+    assert str(exc) == message
+    assert exc.args == (message,)
+    assert repr(exc) == f"NotFound({message!r})"
@@ -75,3 +75,17 @@ class TestQuerySpecRoundTrip:
         assert restored.where is None
         assert restored.order_by is None
         assert restored.limit is None
+
+
+class TestQuerySpecNormalizedOrderBy:
+    """Test QuerySpec.normalized_order_by method."""
+
+    def test_splits_descending_prefix(self):
+        """Entries with a "-" prefix are descending, the others ascending."""
+        spec = QuerySpec(order_by=["-created_at", "name"])
+
+        assert spec.normalized_order_by() == (("created_at", True), ("name", False))
+
+    def test_without_order_by_returns_empty_tuple(self):
+        """No ordering gives an empty tuple."""
+        assert QuerySpec().normalized_order_by() == ()
@@ -1,11 +1,19 @@
 """Tests for the XFiles repository registry manager."""
 
 import logging
+import sys
 
 import pytest
 
 from rag2f.core.dto.result_dto import StatusCode
-from rag2f.core.xfiles import BaseRepository, XFiles, minimal_crud_capabilities
+from rag2f.core.xfiles import (
+    BaseRepository,
+    QueryableRepository,
+    XFiles,
+    implements_protocol,
+    minimal_crud_capabilities,
+    standard_queryable_capabilities,
+)
 
 
 class DummyRepository(BaseRepository):
@@ -45,6 +53,18 @@ class DummyRepository(BaseRepository):
         raise NotImplementedError
 
 
+class StubSpock:
+    """Minimal Spock stub serving rag2f config values from a dict."""
+
+    def __init__(self, **config: object) -> None:
+        """Create a stub Spock with the given rag2f config values."""
+        self.config = config
+
+    def get_rag2f_config(self, key: str, default: object | None = None) -> object | None:
+        """Return a configuration value for tests."""
+        return self.config.get(key, default)
+
+
 class TestXFilesManager:
     """Tests for the XFiles registry manager behavior."""
 
@@ -67,7 +87,7 @@ class TestXFilesManager:
         assert "does not implement the BaseRepository protocol" in result.detail.message
 
     def test_register_success_and_meta_copy(self):
-        """Register should store repositories and meta should be copied on read."""
+        """Register should store repositories and meta should be read-only on read."""
         xfiles = XFiles()
         repo = DummyRepository()
 
@@ -83,9 +103,13 @@ class TestXFilesManager:
         meta1 = xfiles.get_meta("repo1")
         assert meta1 == {}
 
-        # get_meta() must return a copy (mutating it must not affect registry)
-        meta1["purpose"] = "mutated"
+        # get_meta() returns a read-only view; copy_meta() a detached copy
+        with pytest.raises(TypeError):
+            meta1["purpose"] = "mutated"  # type: ignore[index]
+        meta2 = xfiles.copy_meta("repo1")
+        meta2["purpose"] = "mutated"
         assert xfiles.get_meta("repo1") == {}
+        assert xfiles.copy_meta("missing") is None
 
     def test_register_duplicate_same_instance_warns_and_does_not_override_meta(self, caplog):
         """Re-registering the same instance should return success with duplicate detail."""
@@ -175,3 +199,214 @@ class TestXFilesManager:
         get_result = xfiles.execute_get("repo")
         assert get_result.is_ok()
         assert get_result.repository is repo
+
+    def test_get_typed_checks_protocols_per_repository_type(self):
+        """get_typed should match protocols by the repository's own type."""
+        xfiles = XFiles()
+        repo = DummyRepository()
+        xfiles.execute_register("dummy", repo)
+
+        assert xfiles.get_typed("dummy", BaseRepository) is repo
+        # second lookup is answered from the per-type cache
+        assert xfiles.get_typed("dummy", BaseRepository) is repo
+        assert xfiles.get_typed("dummy", QueryableRepository) is None
+        assert implements_protocol(DummyRepository("other"), BaseRepository)
+        assert not implements_protocol(object(), BaseRepository)
+
+    def test_protocol_conformance_via_instance_attributes_is_not_cached(self):
+        """A match that relies on instance attributes does not vouch for the class."""
+        repo = DummyRepository()
+        repo.find = lambda query: []  # type: ignore[attr-defined]
+
+        assert implements_protocol(repo, QueryableRepository)
+        assert not implements_protocol(DummyRepository("plain"), QueryableRepository)
+
+    def test_search_by_meta_matches_linear_scan(self):
+        """Indexed meta search returns the same ids, in order, as a predicate scan."""
+        xfiles = XFiles()
+        metas = {
+            "a": {"type": "mongodb", "domain": "users"},
+            "b": {"type": "redis", "purpose": "cache"},
+            "c": {"type": "mongodb", "domain": "orders"},
+            "d": {"type": "mongodb", "domain": "users", "purpose": "cache"},
+        }
+        for repo_id, meta in metas.items():
+            xfiles.execute_register(repo_id, DummyRepository(repo_id), meta=meta)
+        xfiles.unregister("a")
+        xfiles.execute_register("a", DummyRepository("a"), meta=metas["a"])
+
+        assert xfiles.execute_search_by_meta(type="mongodb").ids == ["c", "d", "a"]
+        assert xfiles.execute_search_by_meta(type="mongodb", domain="users").ids == ["d", "a"]
+        assert xfiles.execute_search_by_meta(domain=["orders", "users"]).ids == ["c", "d", "a"]
+        assert xfiles.execute_search_by_meta(purpose=None).ids == ["b", "d"]
+        assert xfiles.execute_search_by_meta().ids == ["b", "c", "d", "a"]
+
+        result = xfiles.execute_search_by_meta(type="postgresql")
+        assert result.ids == []
+        assert result.detail.code == StatusCode.NO_RESULTS
+
+    def test_search_by_meta_unhashable_values_and_later_mutation(self):
+        """Unhashable meta values are still matched, and meta is copied on register."""
+        xfiles = XFiles()
+        meta = {"type": "mongodb", "tags": ["a", "b"]}
+        xfiles.execute_register("tagged", DummyRepository(), meta=meta)
+        meta["type"] = "redis"
+
+        assert xfiles.execute_search_by_meta(tags=["a", "b"]).ids == []
+        assert xfiles.execute_search_by_meta(tags=[["a", "b"]]).ids == ["tagged"]
+        assert xfiles.execute_search_by_meta(type="mongodb").ids == ["tagged"]
+        assert xfiles.execute_search_by_meta(type={"not": "hashable"}).ids == []
+        # criteria on an unindexed key take the linear-scan matcher
+        assert xfiles.execute_search_by_meta(tags=None, type="mongodb").ids == ["tagged"]
+        assert xfiles.execute_search_by_meta(tags=None, domain="users").ids == []
+        assert xfiles.execute_search_by_meta(tags=None, domain=None).ids == []
+        assert xfiles.execute_search_by_meta(tags=["a", "b"], type="mongodb").ids == []
+
+        assert xfiles.unregister("tagged") is True
+        assert xfiles.execute_search_by_meta(tags=None).ids == []
+
+    def test_capabilities_are_read_per_call_by_default(self):
+        """Without opting in, capability changes after registration are seen."""
+        xfiles = XFiles()
+        repo = DummyRepository()
+        xfiles.execute_register("repo", repo)
+        assert not xfiles.get_capabilities("repo").query.supported
+
+        repo.capabilities = standard_queryable_capabilities
+        assert xfiles.get_capabilities("repo").query.supported
+        found = xfiles.execute_search_by_capability(lambda c: c.query.supported)
+        assert found.ids == ["repo"]
+
+    def test_capabilities_are_cached_until_invalidated(self):
+        """With cache_capabilities, capabilities() is called once until invalidated."""
+        xfiles = XFiles(cache_capabilities=True)
+        repo = DummyRepository()
+        calls = []
+        repo.capabilities = lambda: calls.append(1) or minimal_crud_capabilities()
+        xfiles.execute_register("repo", repo)
+
+        caps = xfiles.get_capabilities("repo")
+        assert xfiles.execute_search_by_capability(lambda c: c is caps).ids == ["repo"]
+        assert len(calls) == 1
+
+        assert xfiles.invalidate_capabilities("repo") is True
+        assert xfiles.get_capabilities("repo") is caps
+        assert len(calls) == 2
+        assert xfiles.invalidate_capabilities("missing") is False
+
+    def test_registered_ids_are_interned(self):
+        """Ids built at runtime are stored as their interned string."""
+        xfiles = XFiles()
+        repo_id = "".join(["users", "_db"])
+        xfiles.execute_register(repo_id, DummyRepository())
+
+        assert xfiles.list_ids()[0] is sys.intern(repo_id)
+        assert xfiles.execute_get(repo_id).repository is not None
+
+    def test_registry_copy_and_live_views(self):
+        """registry is a copy, while registry_view and iter_ids follow later changes."""
+        xfiles = XFiles()
+        repo = DummyRepository()
+        xfiles.execute_register("a", repo)
+        view = xfiles.registry_view
+        ids = xfiles.iter_ids()
+
+        snapshot = xfiles.registry
+        snapshot["b"] = repo
+        assert "b" not in xfiles
+
+        xfiles.execute_register("b", DummyRepository("b"))
+        xfiles.unregister("a")
+        assert list(view) == list(ids) == xfiles.list_ids() == ["b"]
+        assert list(xfiles) == [("b", xfiles.registry["b"])]
+        with pytest.raises(TypeError):
+            view["c"] = repo  # type: ignore[index]
+
+    def test_search_by_range_compares_each_distinct_value(self):
+        """Range search matches inclusive bounds and skips incomparable values."""
+        xfiles = XFiles()
+        for repo_id, priority in [("a", 5), ("b", 1), ("c", "high"), ("d", 3), ("e", 5.0)]:
+            xfiles.execute_register(repo_id, DummyRepository(), meta={"priority": priority})
+        xfiles.execute_register("f", DummyRepository(), meta={})
+
+        assert xfiles.execute_search_by_range("priority", low=3, high=5).ids == ["a", "d", "e"]
+        assert xfiles.execute_search_by_range("priority", high=2).ids == ["b"]
+        assert xfiles.execute_search_by_range("priority", low="a").ids == ["c"]
+
+        result = xfiles.execute_search_by_range("size", low=0)
+        assert result.ids == []
+        assert result.detail.code == StatusCode.NO_RESULTS
+
+    def test_get_default_is_cached_per_purpose_until_registry_or_config_changes(self):
+        """Cached defaults follow registry mutations and configuration changes."""
+        spock = StubSpock(repository_default="a", repository_default_cache="b")
+        xfiles = XFiles(spock=spock)  # type: ignore[arg-type]
+        repo_a, repo_b = DummyRepository("a"), DummyRepository("b")
+        xfiles.execute_register("a", repo_a)
+        xfiles.execute_register("b", repo_b)
+
+        assert xfiles.get_default() is repo_a
+        assert xfiles.get_default() is repo_a
+        assert xfiles.get_default("cache") is repo_b
+
+        spock.config["repository_default"] = "b"
+        assert xfiles.get_default() is repo_b
+
+        spock.config["repository_default"] = "missing"
+        for _ in range(2):
+            with pytest.raises(LookupError, match="Available: a, b"):
+                xfiles.get_default()
+        xfiles.execute_register("c", DummyRepository("c"))
+        with pytest.raises(LookupError, match="Available: a, b, c"):
+            xfiles.get_default()
+        xfiles.unregister("c")
+
+        xfiles.unregister("b")
+        assert xfiles.get_default("cache") is repo_a
+        xfiles.unregister("a")
+        with pytest.raises(LookupError, match="No repositories registered"):
+            xfiles.get_default()
+
+    def test_register_many_checks_items_against_registry_and_batch(self):
+        """Batch registration yields one result per item, as execute_register would."""
+        xfiles = XFiles()
+        repo_a, repo_b = DummyRepository("a"), DummyRepository("b")
+        xfiles.execute_register("a", repo_a)
+
+        results = xfiles.execute_register_many(
+            [
+                ("b", repo_b, {"type": "redis"}),
+                ("a", repo_a, None),
+                ("b", DummyRepository("other"), None),
+                ("", repo_b, None),
+            ]
+        )
+
+        assert [r.created for r in results] == [True, False, False, False]
+        assert results[1].detail.code == StatusCode.DUPLICATE
+        assert results[2].detail.code == StatusCode.ALREADY_EXISTS
+        assert results[3].detail.code == StatusCode.INVALID
+        assert xfiles.list_ids() == ["a", "b"]
+        assert xfiles.execute_search_by_meta(type="redis").repositories == [repo_b]
+
+    def test_register_many_failing_midway_invalidates_cached_defaults(self):
+        """Items stored before a malformed item still invalidate get_default caches."""
+        xfiles = XFiles(spock=StubSpock(repository_default="missing"))  # type: ignore[arg-type]
+        repo_a = DummyRepository("a")
+        xfiles.execute_register("a", repo_a)
+        assert xfiles.get_default() is repo_a
+
+        with pytest.raises(ValueError):
+            xfiles.execute_register_many([("b", DummyRepository("b"), None), ("c",)])  # type: ignore[list-item]
+
+        assert xfiles.list_ids() == ["a", "b"]
+        with pytest.raises(LookupError, match="Available: a, b"):
+            xfiles.get_default()
+
+        xfiles = XFiles()
+        xfiles.execute_register("a", repo_a)
+        assert xfiles.get_default() is repo_a
+        with pytest.raises(ValueError):
+            xfiles.execute_register_many([("b", DummyRepository("b"), None), ("c",)])  # type: ignore[list-item]
+        with pytest.raises(LookupError, match="no default configured"):
+            xfiles.get_default()
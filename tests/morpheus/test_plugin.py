@@ -78,6 +78,10 @@ def test_activate_plugin(plugin):
         "indiana_jones_synthesize",
     }
     assert hook_names == expected_hook_names
+    assert set(plugin.hook_names) == expected_hook_names
+    assert sum(len(hs) for hs in plugin.hooks_by_name.values()) == len(plugin.hooks)
+    for name, hooks in plugin.hooks_by_name.items():
+        assert all(h.name == name for h in hooks)
     for hook in plugin.hooks:
         assert isinstance(hook, PillHook)
         # Check that hook.plugin_id is set and matches plugin._id
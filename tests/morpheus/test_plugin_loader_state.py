@@ -2,6 +2,7 @@
 
 import json
 import sys
+import types
 from pathlib import Path
 
 import pytest
@@ -298,6 +299,38 @@ def my_hook(phone, rag2f=None):
 
     assert mod_a not in sys.modules
     assert mod_b not in sys.modules
+    # intermediate package created by the relative import is dropped as well
+    assert f"plugins.{plugin.id}.src" not in sys.modules
+    assert f"plugins.{plugin.id}" not in sys.modules
+
+
+def test_unload_removes_untracked_plugin_submodules(tmp_path: Path, rag2f):
+    """Modules under the plugin package that the loader did not record are dropped too."""
+    plugin_dir = _make_plugin_dir(tmp_path, "plug_untracked")
+    _write_text(plugin_dir / "src" / "a.py", "VALUE = 1\n")
+
+    plugin = Plugin(rag2f, str(plugin_dir))
+    plugin._load_decorated_functions()
+    # e.g. a helper imported lazily by plugin code, not through the loader
+    untracked = f"plugins.{plugin.id}.src.lazy_helper"
+    sys.modules[untracked] = types.ModuleType(untracked)
+
+    plugin.deactivate()
+
+    assert f"plugins.{plugin.id}.src.a" not in sys.modules
+    assert untracked not in sys.modules
+
+
+@pytest.mark.parametrize("suffix", ["", "/", "/.", "/src/.."])
+def test_plugin_id_is_normalized_folder_name(tmp_path: Path, rag2f, suffix):
+    """The plugin id is the folder name, however the path is spelled."""
+    plugin_dir = _make_plugin_dir(tmp_path, "plug_id")
+    _write_text(plugin_dir / "src" / "dummy.py", "x = 1\n")
+
+    plugin = Plugin(rag2f, str(plugin_dir) + suffix)
+
+    assert plugin.id == "plug_id"
+    assert plugin.id is sys.intern("plug_id")
 
 
 # =====================================
@@ -0,0 +1,86 @@
+"""Tests for PluginManifest normalization and merge helpers."""
+
+import pytest
+from pydantic import ValidationError
+
+from rag2f.core.morpheus.plugin_manifest import PluginManifest
+
+
+class _Label(str):
+    """A str subclass, which must not take the exact-str fast path differently."""
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("  x  ", "x"),
+        ("", None),
+        ("   ", None),
+        (None, None),
+        (12, "12"),
+        (_Label(" y "), "y"),
+    ],
+)
+def test_normalize_str(value, expected):
+    """normalize_str should trim strings and coerce other values."""
+    assert PluginManifest.normalize_str(value) == expected
+
+
+def test_join_keywords_mixed_items():
+    """join_keywords should skip empty items and coerce non-strings."""
+    assert PluginManifest.join_keywords(["a", " ", None, 2, _Label(" b ")]) == "a, 2, b"
+    assert PluginManifest.join_keywords([]) is None
+
+
+def test_apply_fallback_defaults_only_fills_defaultish_fields():
+    """Fallback values replace missing or default fields only."""
+    merged = {"name": "X", "license": "MIT", "version": " 0.0.0 "}
+    fallback = {"license": "Apache", "version": "1.0.0", "author_name": " Bob "}
+
+    out = PluginManifest.apply_fallback_defaults(merged, fallback)
+
+    assert out["license"] == "MIT"
+    assert out["version"] == "1.0.0"
+    assert out["author_name"] == "Bob"
+    assert merged["version"] == " 0.0.0 "
+
+
+@pytest.mark.parametrize("exclude", [(), ("license",)])
+def test_override_if_non_empty(exclude):
+    """Non-empty overrides win, empty ones and excluded keys are ignored."""
+    base = {"name": "Base", "license": "MIT", "version": "1.0"}
+    override = {"name": " Over ", "license": "GPL", "version": "  "}
+
+    merged = PluginManifest.override_if_non_empty(base, override, exclude=exclude)
+
+    assert merged["name"] == "Over"
+    assert merged["version"] == "1.0"
+    assert merged["license"] == ("MIT" if exclude else "GPL")
+
+
+def test_serialize_urls_mapping_priority_then_alphabetical():
+    """Mapping URLs list priority labels first, then the others sorted by label."""
+    urls = {
+        "Tracker": "https://t",
+        "Repository": " https://r ",
+        "Changelog": "https://c",
+        "Homepage": "https://h",
+        "Empty": "  ",
+    }
+
+    assert PluginManifest.serialize_urls(urls) == (
+        "Homepage=https://h, Repository=https://r, Changelog=https://c, Tracker=https://t"
+    )
+    assert PluginManifest.serialize_urls({}) is None
+    assert PluginManifest.serialize_urls({"Homepage": ""}) is None
+
+
+def test_manifest_is_frozen_and_hashable():
+    """Manifests are immutable metadata: assignment fails and equal ones hash equal."""
+    manifest = PluginManifest(name=" Demo ", unknown_field="ignored")
+
+    assert manifest.name == "Demo"
+    assert not hasattr(manifest, "unknown_field")
+    with pytest.raises(ValidationError):
+        manifest.name = "Other"
+    assert hash(manifest) == hash(PluginManifest(name="Demo"))
@@ -95,6 +95,18 @@ description = "from-nested"
     assert plugin.manifest.description == "from-root"
 
 
+def test_pyproject_reparsed_when_file_changes(tmp_path: Path, rag2f):
+    """Cached pyproject parsing should be invalidated when the file changes."""
+    plugin_dir = _make_plugin_dir(tmp_path, "plug")
+    pyproject = plugin_dir / "pyproject.toml"
+
+    _write_text(pyproject, '[project]\nname = "First"\n')
+    assert Plugin(rag2f, str(plugin_dir)).manifest.name == "First"
+
+    _write_text(pyproject, '[project]\nname = "SecondName"\n')
+    assert Plugin(rag2f, str(plugin_dir)).manifest.name == "SecondName"
+
+
 # =====================================
 # B) MERGE POLICY
 # =====================================
@@ -177,6 +189,7 @@ max_rag2f_version = "10"
         (["RAG2F>=1,<2"], "1", "2"),
         (["rag2f>=1.0", "rag2f>=1.5,<2.0"], "1.5", "2.0"),
         (["rag2f==1.5.0"], "Unknown", "1.5.0"),
+        (["requests>=2.0", "Rag2F>=1.0,<2.0", "pydantic<3"], "1.0", "2.0"),
     ],
 )
 def test_bounds_from_dependencies_matrix(tmp_path: Path, rag2f, deps, expected_min, expected_max):